@@ -1,8 +1,10 @@
 # Core Library
+import argparse
 import ast
+import importlib.metadata as importlib_metadata
 import logging
-import sys
-from typing import Any, Generator, List, Tuple, Type
+import re
+from typing import Any, Callable, Dict, Generator, List, Tuple, Type
 
 # First party
 from flake8_simplify.rules.ast_assign import get_sim904, get_sim909
@@ -43,137 +45,245 @@ from flake8_simplify.rules.ast_ifexp import get_sim210, get_sim211, get_sim212
 from flake8_simplify.rules.ast_subscript import get_sim907
 from flake8_simplify.rules.ast_try import get_sim105, get_sim107
 from flake8_simplify.rules.ast_unary_op import (
-    get_sim201,
-    get_sim202,
-    get_sim203,
+    get_sim201_sim203,
     get_sim208,
 )
 from flake8_simplify.rules.ast_with import get_sim117
-from flake8_simplify.utils import Assign, Call, For, If, UnaryOp
+from flake8_simplify.utils import reset_to_source_cache
 
 logger = logging.getLogger(__name__)
 
 
-if sys.version_info < (3, 8):  # pragma: no cover (<PY38)
-    # Third party
-    import importlib_metadata
-else:  # pragma: no cover (PY38+)
-    # Core Library
-    import importlib.metadata as importlib_metadata
+Rule = Callable[[Any], List[Tuple[int, int, str]]]
 
+# Rules which are run for every node of the given type
+RULES: Dict[Type[ast.AST], Tuple[Rule, ...]] = {
+    ast.BoolOp: (
+        get_sim101,
+        get_sim109,
+        get_sim220,
+        get_sim221,
+        get_sim222,
+        get_sim223,
+    ),
+    ast.Assign: (get_sim904, get_sim909),
+    ast.ClassDef: (get_sim120,),
+    ast.Compare: (get_sim118, get_sim300),
+    ast.Expr: (get_sim112,),
+    ast.For: (get_sim104, get_sim110_sim111, get_sim113),
+    ast.IfExp: (get_sim210, get_sim211, get_sim212),
+    ast.Subscript: (get_sim907,),
+    ast.Try: (get_sim105, get_sim107),
+    ast.UnaryOp: (get_sim201_sim203, get_sim208),
+    ast.With: (get_sim117,),
+}
 
-class Visitor(ast.NodeVisitor):
-    def __init__(self) -> None:
+# Rules for calls, by the name of the called function or method. A call is
+# only checked by the rules which are interested in its name
+CALL_RULES: Dict[str, Tuple[Rule, ...]] = {
+    "bool": (get_sim901,),
+    "get": (get_sim910,),
+    "join": (get_sim906,),
+    "open": (get_sim115,),
+    "split": (get_sim905,),
+    "zip": (get_sim911,),
+}
+
+# Rules for if-statements. SIM102 and SIM908 only match if-blocks without
+# else/elif, all other rules need one
+IF_RULES: Tuple[Rule, ...] = (get_sim102, get_sim908)
+IF_ELSE_RULES: Tuple[Rule, ...] = (
+    get_sim103,
+    get_sim108,
+    get_sim114,
+    get_sim116,
+    get_sim401,
+)
+
+
+# Rules are named after the codes they report, e.g. get_sim201_sim203
+_RULE_NAME = re.compile(r"get_sim(\d{3})(?:_sim(\d{3}))?")
+
+
+def _rule_codes(rule: Rule) -> Tuple[str, ...]:
+    """
+    Get the codes a rule can report, based on the name of its function.
+
+    For example, get_sim201_sim203 reports SIM201, SIM202 and SIM203.
+    """
+    match = _RULE_NAME.fullmatch(rule.__name__)
+    if match is None:
+        raise ValueError(
+            f"Rule {rule.__name__} is not named get_simNNN or get_simNNN_simMMM"
+        )
+    first = int(match.group(1))
+    last = int(match.group(2) or first)
+    return tuple(f"SIM{number}" for number in range(first, last + 1))
+
+
+# The codes of every rule. Building it at import checks the rule names.
+RULE_CODES: Dict[Rule, Tuple[str, ...]] = {
+    rule: _rule_codes(rule)
+    for rules in (
+        *RULES.values(),
+        *CALL_RULES.values(),
+        IF_RULES,
+        IF_ELSE_RULES,
+    )
+    for rule in rules
+}
+
+
+class Visitor:
+    def __init__(
+        self,
+        rules: Dict[Type[ast.AST], Tuple[Rule, ...]] = RULES,
+        call_rules: Dict[str, Tuple[Rule, ...]] = CALL_RULES,
+        if_rules: Tuple[Rule, ...] = IF_RULES,
+        if_else_rules: Tuple[Rule, ...] = IF_ELSE_RULES,
+    ) -> None:
         self.errors: List[Tuple[int, int, str]] = []
+        self.rules = rules
+        self.call_rules = call_rules
+        self.if_rules = if_rules
+        self.if_else_rules = if_else_rules
+
+    def visit(self, tree: ast.AST) -> None:
+        """Run the rules on every node of the tree, in source order."""
+        # An explicit stack is cheaper than the recursion of ast.NodeVisitor,
+        # which looks up a method and creates generators for every node
+        stack: List[Any] = [tree]
+        while stack:
+            node = stack.pop()
+            # Lists of fields may also hold e.g. None or names as str
+            if not isinstance(node, ast.AST):
+                continue
+            for rule in self.get_rules(node):
+                self.errors += rule(node)
+            # Reversed, so that the first child is the next one to be popped
+            for field in reversed(node._fields):
+                value = getattr(node, field, None)
+                if type(value) is list:
+                    stack.extend(reversed(value))
+                else:
+                    stack.append(value)
 
-    def visit_Assign(self, node: ast.Assign) -> Any:
-        self.errors += get_sim904(node)
-        self.errors += get_sim909(Assign(node))
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> Any:
-        self.errors += get_sim115(Call(node))
-        self.errors += get_sim901(node)
-        self.errors += get_sim905(node)
-        self.errors += get_sim906(node)
-        self.errors += get_sim910(Call(node))
-        self.errors += get_sim911(node)
-        self.generic_visit(node)
-
-    def visit_With(self, node: ast.With) -> Any:
-        self.errors += get_sim117(node)
-        self.generic_visit(node)
-
-    def visit_Expr(self, node: ast.Expr) -> None:
-        self.errors += get_sim112(node)
-        self.generic_visit(node)
-
-    def visit_BoolOp(self, node: ast.BoolOp) -> None:
-        self.errors += get_sim101(node)
-        self.errors += get_sim109(node)
-        self.errors += get_sim220(node)
-        self.errors += get_sim221(node)
-        self.errors += get_sim222(node)
-        self.errors += get_sim223(node)
-        self.generic_visit(node)
-
-    def visit_If(self, node: ast.If) -> None:
-        self.errors += get_sim102(node)
-        self.errors += get_sim103(node)
-        self.errors += get_sim108(If(node))
-        self.errors += get_sim114(node)
-        self.errors += get_sim116(node)
-        self.errors += get_sim908(node)
-        self.errors += get_sim401(node)
-        self.generic_visit(node)
-
-    def visit_For(self, node: ast.For) -> None:
-        self.errors += get_sim104(node)
-        self.errors += get_sim110_sim111(node)
-        self.errors += get_sim113(For(node))
-        self.generic_visit(node)
-
-    def visit_Subscript(self, node: ast.Subscript) -> None:
-        self.errors += get_sim907(node)
-        self.generic_visit(node)
-
-    def visit_Try(self, node: ast.Try) -> None:
-        self.errors += get_sim105(node)
-        self.errors += get_sim107(node)
-        self.generic_visit(node)
-
-    def visit_UnaryOp(self, node_v: ast.UnaryOp) -> None:
-        node = UnaryOp(node_v)
-        self.errors += get_sim201(node)
-        self.errors += get_sim202(node)
-        self.errors += get_sim203(node)
-        self.errors += get_sim208(node)
-        self.generic_visit(node)
-
-    def visit_IfExp(self, node: ast.IfExp) -> None:
-        self.errors += get_sim210(node)
-        self.errors += get_sim211(node)
-        self.errors += get_sim212(node)
-        self.generic_visit(node)
-
-    def visit_Compare(self, node: ast.Compare) -> None:
-        self.errors += get_sim118(node)
-        self.errors += get_sim300(node)
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        self.errors += get_sim120(node)
-        self.generic_visit(node)
+    def get_rules(self, node: Any) -> Tuple[Rule, ...]:
+        node_type = type(node)
+        if node_type is ast.If:
+            return self.if_else_rules if node.orelse else self.if_rules
+        if node_type is ast.Call:
+            func = node.func
+            if type(func) is ast.Name:
+                return self.call_rules.get(func.id, ())
+            if type(func) is ast.Attribute:
+                return self.call_rules.get(func.attr, ())
+            return ()
+        return self.rules.get(node_type, ())
 
 
 class Plugin:
     name = __name__
-    version = importlib_metadata.version(__name__)  # type: ignore
+    version = importlib_metadata.version(__name__)
+
+    # Only the rules which can report an enabled code, see parse_options
+    _rules = RULES
+    _call_rules = CALL_RULES
+    _if_rules = IF_RULES
+    _if_else_rules = IF_ELSE_RULES
 
     def __init__(self, tree: ast.AST):
         self._tree = tree
 
+    @classmethod
+    def parse_options(cls, options: argparse.Namespace) -> None:
+        """
+        Skip the rules whose codes are disabled by --select / --ignore.
+
+        flake8 would filter their errors anyway, so running them is a waste.
+        The DecisionEngine is not part of flake8's public API. If it is not
+        available, all rules keep running.
+        """
+        try:
+            # Third party
+            from flake8.style_guide import Decision, DecisionEngine
+
+            decider = DecisionEngine(options)
+            enabled = {
+                rule
+                for rule, codes in RULE_CODES.items()
+                if any(
+                    decider.decision_for(code) is Decision.Selected
+                    for code in codes
+                )
+            }
+        except Exception:
+            logger.debug("Could not get the enabled codes", exc_info=True)
+            return
+
+        cls._rules = {
+            node_type: tuple(rule for rule in rules if rule in enabled)
+            for node_type, rules in RULES.items()
+        }
+        cls._call_rules = {
+            name: tuple(rule for rule in rules if rule in enabled)
+            for name, rules in CALL_RULES.items()
+        }
+        cls._if_rules = tuple(rule for rule in IF_RULES if rule in enabled)
+        cls._if_else_rules = tuple(
+            rule for rule in IF_ELSE_RULES if rule in enabled
+        )
+
     def run(self) -> Generator[Tuple[int, int, str, Type[Any]], None, None]:
-        visitor = Visitor()
+        visitor = Visitor(
+            self._rules,
+            self._call_rules,
+            self._if_rules,
+            self._if_else_rules,
+        )
 
         # Add parent
         add_meta(self._tree)
-        visitor.visit(self._tree)
+        reset_to_source_cache()
+        try:
+            visitor.visit(self._tree)
+        finally:
+            reset_to_source_cache()
 
         for line, col, msg in visitor.errors:
             yield line, col, msg, type(self)
 
 
-def add_meta(root: ast.AST, level: int = 0) -> None:
+def add_meta(root: ast.AST) -> None:
+    """
+    Set the "parent", "previous_sibling" and "next_sibling" attributes.
+
+    The attributes are stored directly on the ast nodes, so rules can read
+    e.g. `node.parent` without any wrapper object.
+
+    Additionally, "_has_continue" is set to True on every "continue" and on
+    every if-statement with such a statement in its body, also in nested
+    if-statements, but not in the else-branch. SIM113 uses it to skip loops
+    which may not count every iteration. "_index_in_parent" is set to the
+    position of every statement within the body of its parent.
+    """
+    body = getattr(root, "body", None)
+    if isinstance(body, list):
+        for index, stmt in enumerate(body):
+            stmt._index_in_parent = index
     previous_sibling = None
     for node in ast.iter_child_nodes(root):
-        if level == 0:
-            node.parent = root  # type: ignore
+        node.parent = root  # type: ignore
         node.previous_sibling = previous_sibling  # type: ignore
         node.next_sibling = None  # type: ignore
         if previous_sibling:
             node.previous_sibling.next_sibling = node  # type: ignore
         previous_sibling = node
-        for child in ast.iter_child_nodes(node):
-            child.parent = node  # type: ignore
-        add_meta(node, level=level + 1)
+        add_meta(node)
+        if type(node) is ast.Continue or (
+            type(node) is ast.If
+            and any(
+                getattr(stmt, "_has_continue", False) for stmt in node.body
+            )
+        ):
+            node._has_continue = True  # type: ignore
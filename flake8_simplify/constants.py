@@ -1,7 +1,18 @@
 # Core Library
 import ast
+from typing import Optional
 
-# ast.Constant in Python 3.8, ast.NameConstant in Python 3.6 and 3.7
-BOOL_CONST_TYPES = (ast.Constant, ast.NameConstant)
-AST_CONST_TYPES = (ast.Constant, ast.NameConstant, ast.Str, ast.Num)
-STR_TYPES = (ast.Constant, ast.Str)
+
+def is_str_constant(node: Optional[ast.AST]) -> bool:
+    """Check if the node is a string literal."""
+    return type(node) is ast.Constant and isinstance(node.value, str)
+
+
+def is_bool_constant(node: Optional[ast.AST]) -> bool:
+    """Check if the node is the literal True or False."""
+    return type(node) is ast.Constant and isinstance(node.value, bool)
+
+
+def is_none_constant(node: Optional[ast.AST]) -> bool:
+    """Check if the node is the literal None."""
+    return type(node) is ast.Constant and node.value is None
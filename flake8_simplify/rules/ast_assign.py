@@ -3,7 +3,7 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.utils import Assign, expression_uses_variable, to_source
+from flake8_simplify.utils import expression_uses_variable, to_source
 
 
 def get_sim904(node: ast.Assign) -> List[Tuple[int, int, str]]:
@@ -43,13 +43,13 @@ def get_sim904(node: ast.Assign) -> List[Tuple[int, int, str]]:
     errors: List[Tuple[int, int, str]] = []
     n2 = node.next_sibling  # type: ignore
     if not (
-        isinstance(node.value, ast.Dict)
-        and isinstance(n2, ast.Assign)
+        type(node.value) is ast.Dict
+        and type(n2) is ast.Assign
         and len(n2.targets) == 1
         and len(node.targets) == 1
-        and isinstance(n2.targets[0], ast.Subscript)
-        and isinstance(n2.targets[0].value, ast.Name)
-        and isinstance(node.targets[0], ast.Name)
+        and type(n2.targets[0]) is ast.Subscript
+        and type(n2.targets[0].value) is ast.Name
+        and type(node.targets[0]) is ast.Name
         and n2.targets[0].value.id == node.targets[0].id
     ):
         return errors
@@ -69,7 +69,7 @@ def get_sim904(node: ast.Assign) -> List[Tuple[int, int, str]]:
     return errors
 
 
-def get_sim909(node: Assign) -> List[Tuple[int, int, str]]:
+def get_sim909(node: ast.Assign) -> List[Tuple[int, int, str]]:
     """
     Avoid reflexive assignments
 
@@ -93,7 +93,7 @@ def get_sim909(node: Assign) -> List[Tuple[int, int, str]]:
     errors: List[Tuple[int, int, str]] = []
 
     names = []
-    if isinstance(node.value, (ast.Name, ast.Subscript, ast.Tuple)):
+    if type(node.value) in (ast.Name, ast.Subscript, ast.Tuple):
         names.append(to_source(node.value))
     for target in node.targets:
         names.append(to_source(target))
@@ -101,10 +101,15 @@ def get_sim909(node: Assign) -> List[Tuple[int, int, str]]:
     if len(names) == len(set(names)):
         return errors
 
-    if isinstance(node.parent, ast.ClassDef):
+    if type(node.parent) is ast.ClassDef:  # type: ignore
         return errors
 
-    code = to_source(node.orig)
+    # Join the parts instead of unparsing the whole statement, as the
+    # unparsers differ in whether they put a tuple value in parentheses
+    code = " = ".join(
+        [to_source(target) for target in node.targets]
+        + [to_source(node.value)]
+    )
 
     errors.append(
         (
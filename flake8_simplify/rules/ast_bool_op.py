@@ -4,7 +4,6 @@ from collections import defaultdict
 from typing import Dict, List, Tuple
 
 # First party
-from flake8_simplify.constants import BOOL_CONST_TYPES
 from flake8_simplify.utils import (
     _get_duplicated_isinstance_call_by_node,
     is_same_expression,
@@ -17,7 +16,7 @@ def get_sim101(
 ) -> List[Tuple[int, int, str]]:
     """Get a positions where the duplicate isinstance problem appears."""
     errors: List[Tuple[int, int, str]] = []
-    if not isinstance(node.op, ast.Or):
+    if type(node.op) is not ast.Or:
         return errors
 
     RULE = (
@@ -50,21 +49,21 @@ def get_sim109(node: ast.BoolOp) -> List[Tuple[int, int, str]]:
         )
     """
     errors: List[Tuple[int, int, str]] = []
-    if not isinstance(node.op, ast.Or):
+    if type(node.op) is not ast.Or:
         return errors
     equalities = [
         value
         for value in node.values
-        if isinstance(value, ast.Compare)
+        if type(value) is ast.Compare
         and len(value.ops) == 1
-        and isinstance(value.ops[0], ast.Eq)
+        and type(value.ops[0]) is ast.Eq
     ]
     id2vals: Dict[str, List[ast.Name]] = defaultdict(list)
     for eq in equalities:
         if (
-            isinstance(eq.left, ast.Name)
+            type(eq.left) is ast.Name
             and len(eq.comparators) == 1
-            and isinstance(eq.comparators[0], ast.Name)
+            and type(eq.comparators[0]) is ast.Name
         ):
             id2vals[eq.left.id].append(eq.comparators[0])
     RULE = "SIM109 Use '{value} in {values}' instead of '{or_op}'"
@@ -101,14 +100,14 @@ def get_sim220(node: ast.BoolOp) -> List[Tuple[int, int, str]]:
     )
     """
     errors: List[Tuple[int, int, str]] = []
-    if not (isinstance(node.op, ast.And) and len(node.values) >= 2):
+    if not (type(node.op) is ast.And and len(node.values) >= 2):
         return errors
     # We have a boolean And. Let's make sure there is two times the same
     # expression, but once with a "not"
     negated_expressions = []
     non_negated_expressions = []
     for exp in node.values:
-        if isinstance(exp, ast.UnaryOp) and isinstance(exp.op, ast.Not):
+        if type(exp) is ast.UnaryOp and type(exp.op) is ast.Not:
             negated_expressions.append(exp.operand)
         else:
             non_negated_expressions.append(exp)
@@ -141,14 +140,14 @@ def get_sim221(node: ast.BoolOp) -> List[Tuple[int, int, str]]:
     )
     """
     errors: List[Tuple[int, int, str]] = []
-    if not (isinstance(node.op, ast.Or) and len(node.values) >= 2):
+    if not (type(node.op) is ast.Or and len(node.values) >= 2):
         return errors
     # We have a boolean OR. Let's make sure there is two times the same
     # expression, but once with a "not"
     negated_expressions = []
     non_negated_expressions = []
     for exp in node.values:
-        if isinstance(exp, ast.UnaryOp) and isinstance(exp.op, ast.Not):
+        if type(exp) is ast.UnaryOp and type(exp.op) is ast.Not:
             negated_expressions.append(exp.operand)
         else:
             non_negated_expressions.append(exp)
@@ -181,12 +180,12 @@ def get_sim222(node: ast.BoolOp) -> List[Tuple[int, int, str]]:
     )
     """
     errors: List[Tuple[int, int, str]] = []
-    if not (isinstance(node.op, ast.Or)):
+    if not (type(node.op) is ast.Or):
         return errors
 
     RULE = "SIM222 Use 'True' instead of '... or True'"
     for exp in node.values:
-        if isinstance(exp, BOOL_CONST_TYPES) and exp.value is True:
+        if type(exp) is ast.Constant and exp.value is True:
             errors.append((node.lineno, node.col_offset, RULE))
             return errors
     return errors
@@ -208,12 +207,12 @@ def get_sim223(node: ast.BoolOp) -> List[Tuple[int, int, str]]:
     )
     """
     errors: List[Tuple[int, int, str]] = []
-    if not (isinstance(node.op, ast.And)):
+    if not (type(node.op) is ast.And):
         return errors
 
     RULE = "SIM223 Use 'False' instead of '... and False'"
     for exp in node.values:
-        if isinstance(exp, BOOL_CONST_TYPES) and exp.value is False:
+        if type(exp) is ast.Constant and exp.value is False:
             errors.append((node.lineno, node.col_offset, RULE))
             return errors
     return errors
@@ -5,13 +5,13 @@ import logging
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.constants import BOOL_CONST_TYPES
-from flake8_simplify.utils import Call, to_source
+from flake8_simplify.constants import is_str_constant
+from flake8_simplify.utils import to_source
 
 logger = logging.getLogger(__name__)
 
 
-def get_sim115(node: Call) -> List[Tuple[int, int, str]]:
+def get_sim115(node: ast.Call) -> List[Tuple[int, int, str]]:
     """
     Find places where open() is called without a context handler.
 
@@ -42,9 +42,9 @@ def get_sim115(node: Call) -> List[Tuple[int, int, str]]:
     RULE = "SIM115 Use context handler for opening files"
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.func, ast.Name)
+        type(node.func) is ast.Name
         and node.func.id == "open"
-        and not isinstance(node.parent, ast.withitem)
+        and type(node.parent) is not ast.withitem  # type: ignore
     ):
         return errors
     errors.append((node.lineno, node.col_offset, RULE))
@@ -73,10 +73,10 @@ def get_sim901(node: ast.Call) -> List[Tuple[int, int, str]]:
     RULE = "SIM901 Use '{expected}' instead of '{actual}'"
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.func, ast.Name)
+        type(node.func) is ast.Name
         and node.func.id == "bool"
         and len(node.args) == 1
-        and isinstance(node.args[0], ast.Compare)
+        and type(node.args[0]) is ast.Compare
     ):
         return errors
 
@@ -93,22 +93,36 @@ def get_sim901(node: ast.Call) -> List[Tuple[int, int, str]]:
     return errors
 
 
+def _fmt_str_list(words: List[str]) -> str:
+    """
+    Format a list of strings the same way as json.dumps.
+
+    Plain printable ASCII words are formatted directly; everything which
+    might need escaping is left to json.dumps.
+    """
+    text = " ".join(words)
+    if (
+        not text.isascii()
+        or not text.isprintable()
+        or '"' in text
+        or "\\" in text
+    ):
+        return json.dumps(words)
+    return "[" + ", ".join(f'"{word}"' for word in words) + "]"
+
+
 def get_sim905(node: ast.Call) -> List[Tuple[int, int, str]]:
     RULE = "SIM905 Use '{expected}' instead of '{actual}'"
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.func, ast.Attribute)
+        type(node.func) is ast.Attribute
         and node.func.attr == "split"
-        and isinstance(node.func.value, (ast.Str, ast.Constant))
+        and is_str_constant(node.func.value)
     ):
         return errors
 
-    if isinstance(node.func.value, ast.Constant):
-        value = node.func.value.value
-    else:
-        value = node.func.value.s
-
-    expected = json.dumps(value.split())
+    value: str = node.func.value.value  # type: ignore
+    expected = _fmt_str_list(value.split())
     actual = to_source(node.func.value) + ".split()"
     errors.append(
         (
@@ -120,49 +134,41 @@ def get_sim905(node: ast.Call) -> List[Tuple[int, int, str]]:
     return errors
 
 
+def _is_os_path_join(node: ast.AST) -> bool:
+    """Check if the node is a call of "os.path.join"."""
+    return (
+        type(node) is ast.Call
+        and type(node.func) is ast.Attribute
+        and node.func.attr == "join"
+        and type(node.func.value) is ast.Attribute
+        and node.func.value.attr == "path"
+        and type(node.func.value.value) is ast.Name
+        and node.func.value.value.id == "os"
+    )
+
+
 def get_sim906(node: ast.Call) -> List[Tuple[int, int, str]]:
     RULE = "SIM906 Use '{expected}' instead of '{actual}'"
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.func, ast.Attribute)
-        and isinstance(node.func.value, ast.Attribute)
-        and isinstance(node.func.value.value, ast.Name)
-        and node.func.value.value.id == "os"
-        and node.func.value.attr == "path"
-        and node.func.attr == "join"
+        _is_os_path_join(node)
         and len(node.args) == 2
-        and any(
-            (
-                isinstance(arg, ast.Call)
-                and isinstance(arg.func, ast.Attribute)
-                and isinstance(arg.func.value, ast.Attribute)
-                and isinstance(arg.func.value.value, ast.Name)
-                and arg.func.value.value.id == "os"
-                and arg.func.value.attr == "path"
-                and arg.func.attr == "join"
-            )
-            for arg in node.args
-        )
+        and any(_is_os_path_join(arg) for arg in node.args)
     ):
         return errors
 
     def get_os_path_join_args(node: ast.Call) -> List[str]:
         names: List[str] = []
-        for arg in node.args:
-            if (
-                isinstance(arg, ast.Call)
-                and isinstance(arg.func, ast.Attribute)
-                and isinstance(arg.func.value, ast.Attribute)
-                and isinstance(arg.func.value.value, ast.Name)
-                and arg.func.value.value.id == "os"
-                and arg.func.value.attr == "path"
-                and arg.func.attr == "join"
-            ):
-                names = names + get_os_path_join_args(arg)
-            elif isinstance(arg, ast.Name):
+        # Depth-first, left-to-right walk over nested os.path.join calls
+        stack = list(reversed(node.args))
+        while stack:
+            arg = stack.pop()
+            if _is_os_path_join(arg):
+                stack.extend(reversed(arg.args))  # type: ignore
+            elif type(arg) is ast.Name:
                 names.append(arg.id)
-            elif isinstance(arg, ast.Str):
-                names.append(f"'{arg.s}'")
+            elif is_str_constant(arg):
+                names.append(f"'{arg.value}'")  # type: ignore
             else:
                 logger.debug(
                     f"Unexpected os.path.join arg: {arg} -- {to_source(arg)}"
@@ -183,7 +189,7 @@ def get_sim906(node: ast.Call) -> List[Tuple[int, int, str]]:
     return errors
 
 
-def get_sim910(node: Call) -> List[Tuple[int, int, str]]:
+def get_sim910(node: ast.Call) -> List[Tuple[int, int, str]]:
     """
     Get a list of all usages of "dict.get(key, None)"
 
@@ -207,16 +213,16 @@ def get_sim910(node: Call) -> List[Tuple[int, int, str]]:
     RULE = "SIM910 Use '{expected}' instead of '{actual}'"
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.func, ast.Attribute)
+        type(node.func) is ast.Attribute
         and node.func.attr == "get"
-        and isinstance(node.func.ctx, ast.Load)
+        and type(node.func.ctx) is ast.Load
     ):
         return errors
 
     # check the argument value
     if not (
         len(node.args) == 2
-        and isinstance(node.args[1], BOOL_CONST_TYPES)
+        and type(node.args[1]) is ast.Constant
         and node.args[1].value is None
     ):
         return errors
@@ -274,20 +280,20 @@ def get_sim911(node: ast.AST) -> List[Tuple[int, int, str]]:
     )
     errors: List[Tuple[int, int, str]] = []
 
-    if isinstance(node, ast.Call) and (
-        isinstance(node.func, ast.Name)
+    if type(node) is ast.Call and (
+        type(node.func) is ast.Name
         and node.func.id == "zip"
         and len(node.args) == 2
     ):
         first_arg, second_arg = node.args
         if (
-            isinstance(first_arg, ast.Call)
-            and isinstance(first_arg.func, ast.Attribute)
-            and isinstance(first_arg.func.value, ast.Name)
+            type(first_arg) is ast.Call
+            and type(first_arg.func) is ast.Attribute
+            and type(first_arg.func.value) is ast.Name
             and first_arg.func.attr == "keys"
-            and isinstance(second_arg, ast.Call)
-            and isinstance(second_arg.func, ast.Attribute)
-            and isinstance(second_arg.func.value, ast.Name)
+            and type(second_arg) is ast.Call
+            and type(second_arg.func) is ast.Attribute
+            and type(second_arg.func.value) is ast.Name
             and second_arg.func.attr == "values"
             and first_arg.func.value.id == second_arg.func.value.id
         ):
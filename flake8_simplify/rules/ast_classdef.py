@@ -14,7 +14,7 @@ def get_sim120(node: ast.ClassDef) -> List[Tuple[int, int, str]]:
     errors: List[Tuple[int, int, str]] = []
     if not (
         len(node.bases) == 1
-        and isinstance(node.bases[0], ast.Name)
+        and type(node.bases[0]) is ast.Name
         and node.bases[0].id == "object"
     ):
         return errors
@@ -3,7 +3,6 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.constants import AST_CONST_TYPES
 from flake8_simplify.utils import to_source
 
 
@@ -30,22 +29,21 @@ def get_sim118(node: ast.Compare) -> List[Tuple[int, int, str]]:
     errors: List[Tuple[int, int, str]] = []
     if not (
         len(node.ops) == 1
-        and isinstance(node.ops[0], ast.In)
+        and type(node.ops[0]) is ast.In
         and len(node.comparators) == 1
     ):
         return errors
     call_node = node.comparators[0]
-    if not isinstance(call_node, ast.Call):
+    if type(call_node) is not ast.Call:
         return errors
 
     attr_node = call_node.func
     if not (
-        isinstance(call_node.func, ast.Attribute)
-        and call_node.func.attr == "keys"
-        and isinstance(call_node.func.ctx, ast.Load)
+        type(attr_node) is ast.Attribute
+        and attr_node.attr == "keys"
+        and type(attr_node.ctx) is ast.Load
     ):
         return errors
-    assert isinstance(attr_node, ast.Attribute), "hint for mypy"  # noqa
 
     key_str = to_source(node.left)
     dict_str = to_source(attr_node.value)
@@ -76,9 +74,9 @@ def get_sim300(node: ast.Compare) -> List[Tuple[int, int, str]]:
     )
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.left, AST_CONST_TYPES)
+        type(node.left) is ast.Constant
         and len(node.ops) == 1
-        and isinstance(node.ops[0], ast.Eq)
+        and type(node.ops[0]) is ast.Eq
     ):
         return errors
 
@@ -3,10 +3,26 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.constants import STR_TYPES
+from flake8_simplify.constants import is_str_constant
 from flake8_simplify.utils import to_source
 
 
+def _has_lowercase(string: str) -> bool:
+    """Check if upper-casing the string would change it."""
+    # str.isupper does not create a new string
+    return not string.isupper() and string != string.upper()
+
+
+def _is_os_environ(node: ast.expr) -> bool:
+    """Check if the node is "os.environ"."""
+    return (
+        type(node) is ast.Attribute
+        and node.attr == "environ"
+        and type(node.value) is ast.Name
+        and node.value.id == "os"
+    )
+
+
 def get_sim112(node: ast.Expr) -> List[Tuple[int, int, str]]:
     """
     Find non-capitalized calls to environment variables.
@@ -26,78 +42,70 @@ def get_sim112(node: ast.Expr) -> List[Tuple[int, int, str]]:
             ),
         ),
     """
-    RULE = "SIM112 Use '{expected}' instead of '{original}'"
+    if type(node.value) is ast.Subscript:
+        return _get_sim112_subscript(node, node.value)
+    if type(node.value) is ast.Call:
+        return _get_sim112_call(node, node.value)
+    return []
+
+
+def _get_sim112_subscript(
+    node: ast.Expr, subscript: ast.Subscript
+) -> List[Tuple[int, int, str]]:
+    """Find SIM112 for 'os.environ["foo"]'."""
     errors: List[Tuple[int, int, str]] = []
+    if not _is_os_environ(subscript.value):
+        return errors
+    string_part = subscript.slice
+    if isinstance(string_part, ast.Index):
+        # Python < 3.9
+        string_part = string_part.value  # type: ignore
+    if not is_str_constant(string_part):
+        return errors
 
-    is_index_call = (
-        isinstance(node.value, ast.Subscript)
-        and isinstance(node.value.value, ast.Attribute)
-        and isinstance(node.value.value.value, ast.Name)
-        and node.value.value.value.id == "os"
-        and node.value.value.attr == "environ"
-        and (
-            (
-                isinstance(node.value.slice, ast.Index)
-                and isinstance(node.value.slice.value, STR_TYPES)  # type: ignore  # noqa
-            )
-            or isinstance(node.value.slice, ast.Constant)
+    env_name = to_source(string_part)
+    if not _has_lowercase(env_name):
+        return errors
+    original = to_source(node)
+    expected = f"os.environ[{env_name.upper()}]"
+    errors.append(
+        (
+            node.lineno,
+            node.col_offset,
+            f"SIM112 Use '{expected}' instead of '{original}'",
         )
     )
-    if is_index_call:
-        subscript = node.value
-        assert isinstance(subscript, ast.Subscript), "hint for mypy"  # noqa
-        slice_ = subscript.slice
-        if isinstance(slice_, ast.Index):
-            # Python < 3.9
-            string_part = slice_.value  # type: ignore
-            assert isinstance(string_part, STR_TYPES), "hint for mypy"  # noqa
-            env_name = to_source(string_part)
-        elif isinstance(slice_, ast.Constant):
-            # Python 3.9
-            env_name = to_source(slice_)
+    return errors
 
-        # Check if this has a change
-        has_change = env_name != env_name.upper()
 
-    is_get_call = (
-        isinstance(node.value, ast.Call)
-        and isinstance(node.value.func, ast.Attribute)
-        and isinstance(node.value.func.value, ast.Attribute)
-        and isinstance(node.value.func.value.value, ast.Name)
-        and node.value.func.value.value.id == "os"
-        and node.value.func.value.attr == "environ"
-        and node.value.func.attr == "get"
-        and len(node.value.args) in [1, 2]
-        and isinstance(node.value.args[0], STR_TYPES)
-    )
-    if is_get_call:
-        call = node.value
-        assert isinstance(call, ast.Call), "hint for mypy"  # noqa
-        string_part = call.args[0]
-        assert isinstance(string_part, STR_TYPES), "hint for mypy"  # noqa
-        env_name = to_source(string_part)
-        # Check if this has a change
-        has_change = env_name != env_name.upper()
-    if not (is_index_call or is_get_call) or not has_change:
+def _get_sim112_call(
+    node: ast.Expr, call: ast.Call
+) -> List[Tuple[int, int, str]]:
+    """Find SIM112 for 'os.environ.get("foo")'."""
+    errors: List[Tuple[int, int, str]] = []
+    if not (
+        type(call.func) is ast.Attribute
+        and call.func.attr == "get"
+        and _is_os_environ(call.func.value)
+        and len(call.args) in [1, 2]
+        and is_str_constant(call.args[0])
+    ):
         return errors
-    if is_index_call:
-        original = to_source(node)
-        expected = f"os.environ[{env_name.upper()}]"
-    elif is_get_call:
-        original = to_source(node)
-        if len(node.value.args) == 1:  # type: ignore
-            expected = f"os.environ.get({env_name.upper()})"
-        else:
-            assert isinstance(node.value, ast.Call), "hint for mypy"  # noqa
-            default_value = to_source(node.value.args[1])
-            expected = f"os.environ.get({env_name.upper()}, {default_value})"
-    else:
+
+    env_name = to_source(call.args[0])
+    if not _has_lowercase(env_name):
         return errors
+    original = to_source(node)
+    if len(call.args) == 1:
+        expected = f"os.environ.get({env_name.upper()})"
+    else:
+        default_value = to_source(call.args[1])
+        expected = f"os.environ.get({env_name.upper()}, {default_value})"
     errors.append(
         (
             node.lineno,
             node.col_offset,
-            RULE.format(original=original, expected=expected),
+            f"SIM112 Use '{expected}' instead of '{original}'",
         )
     )
     return errors
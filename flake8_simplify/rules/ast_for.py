@@ -3,13 +3,8 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.constants import BOOL_CONST_TYPES
-from flake8_simplify.utils import (
-    For,
-    body_contains_continue,
-    is_constant_increase,
-    to_source,
-)
+from flake8_simplify.constants import is_bool_constant
+from flake8_simplify.utils import is_constant_increase, to_source
 
 
 def get_sim104(node: ast.For) -> List[Tuple[int, int, str]]:
@@ -36,33 +31,28 @@ def get_sim104(node: ast.For) -> List[Tuple[int, int, str]]:
         ),
 
     """
-    RULE = "SIM104 Use 'yield from {iterable}'"
     errors: List[Tuple[int, int, str]] = []
+    if len(node.body) != 1 or node.orelse:
+        return errors
+    stmt = node.body[0]
     if (
-        len(node.body) != 1
-        or not isinstance(node.body[0], ast.Expr)
-        or not isinstance(node.body[0].value, ast.Yield)
-        or not isinstance(node.target, ast.Name)
-        or not isinstance(node.body[0].value.value, ast.Name)
-        or node.target.id != node.body[0].value.value.id
-        or node.orelse != []
+        type(stmt) is not ast.Expr
+        or type(stmt.value) is not ast.Yield
+        or type(node.target) is not ast.Name
+        or type(stmt.value.value) is not ast.Name
+        or node.target.id != stmt.value.value.id
     ):
         return errors
 
+    # The module itself has no parent attribute, which ends the walk
     parent = getattr(node, "parent", None)
-    while (
-        parent
-        and hasattr(parent, "parent")
-        and parent.parent is not parent
-        and not isinstance(parent, ast.AsyncFunctionDef)
-    ):
+    while parent is not None:
+        if type(parent) is ast.AsyncFunctionDef:
+            return errors
         parent = getattr(parent, "parent", None)
-
-    if isinstance(parent, ast.AsyncFunctionDef):  # type: ignore
-        return errors
     iterable = to_source(node.iter)
     errors.append(
-        (node.lineno, node.col_offset, RULE.format(iterable=iterable))
+        (node.lineno, node.col_offset, f"SIM104 Use 'yield from {iterable}'")
     )
     return errors
 
@@ -94,33 +84,30 @@ def get_sim110_sim111(node: ast.For) -> List[Tuple[int, int, str]]:
     ),
     Return(value=Constant(value=False, kind=None))
     """
-    SIM110 = "SIM110 Use 'return any({check} for {target} in {iterable})'"
-    SIM111 = "SIM111 Use 'return all({check} for {target} in {iterable})'"
     errors: List[Tuple[int, int, str]] = []
+    # Only few loops are directly followed by a return, check this first
+    if type(node.next_sibling) is not ast.Return:  # type: ignore
+        return errors
     if not (
         len(node.body) == 1
-        and isinstance(node.body[0], ast.If)
+        and type(node.body[0]) is ast.If
         and len(node.body[0].body) == 1
-        and isinstance(node.body[0].body[0], ast.Return)
-        and isinstance(node.body[0].body[0].value, BOOL_CONST_TYPES)
+        and type(node.body[0].body[0]) is ast.Return
+        and is_bool_constant(node.body[0].body[0].value)
     ):
         return errors
-    if not hasattr(node.body[0].body[0].value, "value"):
-        return errors
-    if not isinstance(node.next_sibling, ast.Return):  # type: ignore
-        return errors
     check = to_source(node.body[0].test)
     target = to_source(node.target)
     iterable = to_source(node.iter)
-    if node.body[0].body[0].value.value is True:
+    if node.body[0].body[0].value.value is True:  # type: ignore
         errors.append(
             (
                 node.lineno,
                 node.col_offset,
-                SIM110.format(check=check, target=target, iterable=iterable),
+                f"SIM110 Use 'return any({check} for {target} in {iterable})'",
             )
         )
-    elif node.body[0].body[0].value.value is False:
+    elif node.body[0].body[0].value.value is False:  # type: ignore
         is_compound_expression = " and " in check or " or " in check
 
         if is_compound_expression:
@@ -134,13 +121,13 @@ def get_sim110_sim111(node: ast.For) -> List[Tuple[int, int, str]]:
             (
                 node.lineno,
                 node.col_offset,
-                SIM111.format(check=check, target=target, iterable=iterable),
+                f"SIM111 Use 'return all({check} for {target} in {iterable})'",
             )
         )
     return errors
 
 
-def get_sim113(node: For) -> List[Tuple[int, int, str]]:
+def get_sim113(node: ast.For) -> List[Tuple[int, int, str]]:
     """
     Find loops in which "enumerate" should be used.
 
@@ -163,47 +150,40 @@ def get_sim113(node: For) -> List[Tuple[int, int, str]]:
     """
     errors: List[Tuple[int, int, str]] = []
     variable_candidates = []
-    if body_contains_continue(node.body):
+    # Set by add_meta on a continue and on if-statements containing one
+    if any(getattr(stmt, "_has_continue", False) for stmt in node.body):
         return errors
 
     # Find variables that might just count the iteration of the current loop
     for expression in node.body:
         if (
-            isinstance(expression, ast.AugAssign)
+            type(expression) is ast.AugAssign
             and is_constant_increase(expression)
-            and isinstance(expression.target, ast.Name)
+            and type(expression.target) is ast.Name
         ):
             variable_candidates.append(expression.target)
-    str_candidates = [to_source(x) for x in variable_candidates]
+    str_candidates = {x.id for x in variable_candidates}
+    if not str_candidates:
+        return errors
 
-    older_siblings = []
-    for older_sibling in node.parent.body:  # type: ignore
-        if older_sibling is node:
-            break
-        older_siblings.append(older_sibling)
+    # Set by add_meta; it is missing if the loop is not part of parent.body
+    index = getattr(node, "_index_in_parent", None)
+    older_siblings = node.parent.body[:index]  # type: ignore
 
     matches = [
         n.targets[0]
         for n in older_siblings
-        if isinstance(n, ast.Assign)
+        if type(n) is ast.Assign
         and len(n.targets) == 1
-        and isinstance(n.targets[0], ast.Name)
-        and to_source(n.targets[0]) in str_candidates
+        and type(n.targets[0]) is ast.Name
+        and n.targets[0].id in str_candidates
     ]
-    if len(matches) == 0:
-        return errors
-
-    sibling = node.previous_sibling
-    while sibling is not None:
-        sibling = sibling.previous_sibling
-
     for match in matches:
-        variable = to_source(match)
         errors.append(
             (
                 match.lineno,
                 match.col_offset,
-                f"SIM113 Use enumerate for '{variable}'",
+                f"SIM113 Use enumerate for '{match.id}'",
             )
         )
     return errors
@@ -3,13 +3,8 @@ import ast
 from typing import Any, Dict, List, Optional, Tuple
 
 # First party
-from flake8_simplify.constants import AST_CONST_TYPES, BOOL_CONST_TYPES
-from flake8_simplify.utils import (
-    If,
-    get_if_body_pairs,
-    is_body_same,
-    to_source,
-)
+from flake8_simplify.constants import is_bool_constant
+from flake8_simplify.utils import get_if_body_pairs, is_body_same, to_source
 
 
 def get_sim102(node: ast.If) -> List[Tuple[int, int, str]]:
@@ -24,7 +19,7 @@ def get_sim102(node: ast.If) -> List[Tuple[int, int, str]]:
     is_pattern_1 = (
         node.orelse == []
         and len(node.body) == 1
-        and isinstance(node.body[0], ast.If)
+        and type(node.body[0]) is ast.If
         and node.body[0].orelse == []
     )
     # ## Pattern 2
@@ -36,15 +31,16 @@ def get_sim102(node: ast.If) -> List[Tuple[int, int, str]]:
 
     if not is_pattern_1:
         return errors
-    is_main_check = (
-        isinstance(node.test, ast.Compare)
-        and isinstance(node.test.left, ast.Name)
-        and node.test.left.id == "__name__"
-        and len(node.test.comparators) == 1
-        and isinstance(node.test.comparators[0], ast.Str)
-        and node.test.comparators[0].s == "__main__"
-    )
-    if is_main_check:
+    # The "if __name__ == '__main__':" idiom is fine
+    test = node.test
+    if (
+        type(test) is ast.Compare
+        and type(test.left) is ast.Name
+        and test.left.id == "__name__"
+        and len(test.comparators) == 1
+        and type(test.comparators[0]) is ast.Constant
+        and test.comparators[0].value == "__main__"
+    ):
         return errors
     errors.append((node.lineno, node.col_offset, RULE))
     return errors
@@ -76,31 +72,28 @@ def get_sim103(node: ast.If) -> List[Tuple[int, int, str]]:
         ),
 
     """
-    SIM103 = "SIM103 Return the condition {cond} directly"
     errors: List[Tuple[int, int, str]] = []
     if (
         len(node.body) != 1
-        or not isinstance(node.body[0], ast.Return)
-        or not isinstance(node.body[0].value, BOOL_CONST_TYPES)
-        or not (
-            node.body[0].value.value is True
-            or node.body[0].value.value is False
-        )
+        or type(node.body[0]) is not ast.Return
+        or not is_bool_constant(node.body[0].value)
         or len(node.orelse) != 1
-        or not isinstance(node.orelse[0], ast.Return)
-        or not isinstance(node.orelse[0].value, BOOL_CONST_TYPES)
-        or not (
-            node.orelse[0].value.value is True
-            or node.orelse[0].value.value is False
-        )
+        or type(node.orelse[0]) is not ast.Return
+        or not is_bool_constant(node.orelse[0].value)
     ):
         return errors
     cond = to_source(node.test)
-    errors.append((node.lineno, node.col_offset, SIM103.format(cond=cond)))
+    errors.append(
+        (
+            node.lineno,
+            node.col_offset,
+            f"SIM103 Return the condition {cond} directly",
+        )
+    )
     return errors
 
 
-def get_sim108(node: If) -> List[Tuple[int, int, str]]:
+def get_sim108(node: ast.If) -> List[Tuple[int, int, str]]:
     """
     Get a list of all if-elses which could be a ternary operator assignment.
 
@@ -122,45 +115,52 @@ def get_sim108(node: If) -> List[Tuple[int, int, str]]:
             ],
         ),
     """
-    RULE = (
-        "SIM108 Use ternary operator "
-        "'{assign} = {body} if {cond} else {orelse}' "
-        "instead of if-else-block"
-    )
     errors: List[Tuple[int, int, str]] = []
     if not (
         len(node.body) == 1
-        and isinstance(node.body[0], ast.Assign)
+        and type(node.body[0]) is ast.Assign
         and len(node.orelse) == 1
-        and isinstance(node.orelse[0], ast.Assign)
+        and type(node.orelse[0]) is ast.Assign
         and len(node.body[0].targets) == 1
         and len(node.orelse[0].targets) == 1
-        and isinstance(node.body[0].targets[0], ast.Name)
-        and isinstance(node.orelse[0].targets[0], ast.Name)
+        and type(node.body[0].targets[0]) is ast.Name
+        and type(node.orelse[0].targets[0]) is ast.Name
         and node.body[0].targets[0].id == node.orelse[0].targets[0].id
     ):
         return errors
 
     target_var = node.body[0].targets[0]
-    assign = to_source(target_var)
+    assign = target_var.id
 
     # It's part of a bigger if-elseif block:
     # https://github.com/MartinThoma/flake8-simplify/issues/115
-    if isinstance(node.parent, ast.If):
-        for n in node.parent.body:
+    parent = node.parent  # type: ignore
+    if type(parent) is ast.If:
+        for n in parent.body:
             if (
-                isinstance(n, ast.Assign)
-                and isinstance(n.targets[0], ast.Name)
+                type(n) is ast.Assign
+                and type(n.targets[0]) is ast.Name
                 and n.targets[0].id == target_var.id
             ):
                 return errors
 
-    body = to_source(node.body[0].value)
-    cond = to_source(node.test)
-    orelse = to_source(node.orelse[0].value)
-    new_code = RULE.format(assign=assign, body=body, cond=cond, orelse=orelse)
-    if len(new_code) > 79:
-        return errors
+    # Only messages up to 79 characters are reported, so stop unparsing as
+    # soon as the parts get too long
+    length = len(assign) + len(
+        "SIM108 Use ternary operator ' =  if  else ' instead of if-else-block"
+    )
+    parts = []
+    for part in (node.body[0].value, node.test, node.orelse[0].value):
+        parts.append(to_source(part))
+        length += len(parts[-1])
+        if length > 79:
+            return errors
+    body, cond, orelse = parts
+    new_code = (
+        "SIM108 Use ternary operator "
+        f"'{assign} = {body} if {cond} else {orelse}' "
+        "instead of if-else-block"
+    )
     errors.append((node.lineno, node.col_offset, new_code))
     return errors
 
@@ -191,26 +191,33 @@ def get_sim114(node: ast.If) -> List[Tuple[int, int, str]]:
             ],
         ),
     """
-    SIM114 = "SIM114 Use logical or (({cond1}) or ({cond2})) and a single body"
     errors: List[Tuple[int, int, str]] = []
+    # An elif is checked as part of the chain of the first if-statement.
+    # Checking it again would compare the rest of the chain once per elif.
+    parent = getattr(node, "parent", None)
+    if (
+        type(parent) is ast.If
+        and len(parent.orelse) == 1
+        and parent.orelse[0] is node
+    ):
+        return errors
     if_body_pairs = get_if_body_pairs(node)
-    error_pairs = []
-    for i in range(len(if_body_pairs) - 1):
-        # It's not all combinations because of this:
-        # https://github.com/MartinThoma/flake8-simplify/issues/70
-        # #issuecomment-924074984
-        ifbody1 = if_body_pairs[i]
-        ifbody2 = if_body_pairs[i + 1]
-        if is_body_same(ifbody1[1], ifbody2[1]):
-            error_pairs.append((ifbody1, ifbody2))
-    for ifbody1, ifbody2 in error_pairs:
+    # It's not all combinations because of this:
+    # https://github.com/MartinThoma/flake8-simplify/issues/70
+    # #issuecomment-924074984
+    for (cond1, body1), (cond2, body2) in zip(
+        if_body_pairs, if_body_pairs[1:]
+    ):
+        if not is_body_same(body1, body2):
+            continue
+        # Only conditions of matching pairs are unparsed. A condition shared
+        # by two matching pairs is served from the to_source cache.
         errors.append(
             (
-                ifbody1[0].lineno,
-                ifbody1[0].col_offset,
-                SIM114.format(
-                    cond1=to_source(ifbody1[0]), cond2=to_source(ifbody2[0])
-                ),
+                cond1.lineno,
+                cond1.col_offset,
+                f"SIM114 Use logical or (({to_source(cond1)}) or "
+                f"({to_source(cond2)})) and a single body",
             )
         )
     return errors
@@ -225,78 +232,53 @@ def get_sim116(node: ast.If) -> List[Tuple[int, int, str]]:
     * Each if-statement must just have a "return"
     * Else must also just have a return
     """
-    SIM116 = (
-        "SIM116 Use a dictionary lookup instead of 3+ if/elif-statements: "
-        "return {ret}"
-    )
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.test, ast.Compare)
-        and isinstance(node.test.left, ast.Name)
-        and len(node.test.ops) == 1
-        and isinstance(node.test.ops[0], ast.Eq)
-        and len(node.test.comparators) == 1
-        and isinstance(node.test.comparators[0], AST_CONST_TYPES)
-        and len(node.body) == 1
-        and isinstance(node.body[0], ast.Return)
-        and len(node.orelse) == 1
-        and isinstance(node.orelse[0], ast.If)
+        type(node.test) is ast.Compare and type(node.test.left) is ast.Name
     ):
         return errors
+
+    # Count the if/elif branches first, most chains are too short
+    branches = 1
+    elif_node = node
+    while len(elif_node.orelse) == 1 and type(elif_node.orelse[0]) is ast.If:
+        elif_node = elif_node.orelse[0]
+        branches += 1
+    if branches < 3:
+        return errors
+
     variable = node.test.left
-    child: Optional[ast.If] = node.orelse[0]
-    assert isinstance(child, ast.If), "hint for mypy"
     else_value: Optional[str] = None
-    key_value_pairs: Dict[Any, Any]
-    if isinstance(node.test.comparators[0], ast.Str):
-        value = to_source(node.body[0].value)
-        if value[0] == '"' and value[-1] == '"':
-            value = value[1:-1]
-        key_value_pairs = {node.test.comparators[0].s: value}
-    elif isinstance(node.test.comparators[0], ast.Num):
-        key_value_pairs = {
-            node.test.comparators[0].n: to_source(node.body[0].value)
-        }
-    else:
-        key_value_pairs = {
-            node.test.comparators[0].value: to_source(node.body[0].value)
-        }
+    key_value_pairs: Dict[Any, Any] = {}
+    child: Optional[ast.If] = node
     while child:
         if not (
-            isinstance(child.test, ast.Compare)
-            and isinstance(child.test.left, ast.Name)
+            type(child.test) is ast.Compare
+            and type(child.test.left) is ast.Name
             and child.test.left.id == variable.id
             and len(child.test.ops) == 1
-            and isinstance(child.test.ops[0], ast.Eq)
+            and type(child.test.ops[0]) is ast.Eq
             and len(child.test.comparators) == 1
-            and isinstance(child.test.comparators[0], AST_CONST_TYPES)
+            and type(child.test.comparators[0]) is ast.Constant
             and len(child.body) == 1
-            and isinstance(child.body[0], ast.Return)
+            and type(child.body[0]) is ast.Return
             and len(child.orelse) <= 1
         ):
             return errors
-        return_call = child.body[0]
-        assert isinstance(return_call, ast.Return), "hint for mypy"
-        if isinstance(return_call.value, ast.Call):
+        return_value = child.body[0].value
+        if type(return_value) is ast.Call:
             # See https://github.com/MartinThoma/flake8-simplify/issues/113
             return errors
-        key: Any
-        if isinstance(child.test.comparators[0], ast.Str):
-            key = child.test.comparators[0].s
-        elif isinstance(child.test.comparators[0], ast.Num):
-            key = child.test.comparators[0].n
+        key = child.test.comparators[0].value
+        if type(return_value) is ast.Constant:
+            key_value_pairs[key] = return_value.value
         else:
-            key = child.test.comparators[0].value
-
-        value = to_source(child.body[0].value)
-        if value[0] == '"' and value[-1] == '"':
-            value = value[1:-1]
-        key_value_pairs[key] = value
+            key_value_pairs[key] = to_source(return_value)
 
         if len(child.orelse) == 1:
-            if isinstance(child.orelse[0], ast.If):
+            if type(child.orelse[0]) is ast.If:
                 child = child.orelse[0]
-            elif isinstance(child.orelse[0], ast.Return):
+            elif type(child.orelse[0]) is ast.Return:
                 else_value = to_source(child.orelse[0].value)
                 child = None
             else:
@@ -309,7 +291,14 @@ def get_sim116(node: ast.If) -> List[Tuple[int, int, str]]:
         ret = f"{key_value_pairs}.get({variable.id}, {else_value})"
     else:
         ret = f"{key_value_pairs}.get({variable.id})"
-    errors.append((node.lineno, node.col_offset, SIM116.format(ret=ret)))
+    errors.append(
+        (
+            node.lineno,
+            node.col_offset,
+            "SIM116 Use a dictionary lookup instead of 3+ if/elif-statements: "
+            f"return {ret}",
+        )
+    )
     return errors
 
 
@@ -317,15 +306,11 @@ def get_sim908(node: ast.If) -> List[Tuple[int, int, str]]:
     """
     Get all if-blocks which only check if a key is in a dictionary.
     """
-    RULE = (
-        "SIM908 Use '{dictname}.get({key})' instead of "
-        "'if {key} in {dictname}: {dictname}[{key}]'"
-    )
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.test, ast.Compare)
+        type(node.test) is ast.Compare
         and len(node.test.ops) == 1
-        and isinstance(node.test.ops[0], ast.In)
+        and type(node.test.ops[0]) is ast.In
         and len(node.body) == 1
         and len(node.orelse) == 0
     ):
@@ -335,10 +320,10 @@ def get_sim908(node: ast.If) -> List[Tuple[int, int, str]]:
     # the body the developer might remove the element from the list
     # We need to have a look at the body
     if not (
-        isinstance(node.body[0], ast.Assign)
-        and isinstance(node.body[0].value, ast.Subscript)
+        type(node.body[0]) is ast.Assign
+        and type(node.body[0].value) is ast.Subscript
         and len(node.body[0].targets) == 1
-        and isinstance(node.body[0].targets[0], ast.Name)
+        and type(node.body[0].targets[0]) is ast.Name
     ):
         return errors
 
@@ -353,7 +338,8 @@ def get_sim908(node: ast.If) -> List[Tuple[int, int, str]]:
         (
             node.lineno,
             node.col_offset,
-            RULE.format(key=key, dictname=dictname),
+            f"SIM908 Use '{dictname}.get({key})' instead of "
+            f"'if {key} in {dictname}: {dictname}[{key}]'",
         )
     )
     return errors
@@ -435,81 +421,57 @@ def get_sim401(node: ast.If) -> List[Tuple[int, int, str]]:
         )
 
     """
-    SIM401 = (
-        "SIM401 Use '{value} = {dict}.get({key}, {default_value})' "
-        "instead of an if-block"
-    )
     errors: List[Tuple[int, int, str]] = []
-    is_pattern_1 = (
-        len(node.body) == 1
-        and isinstance(node.body[0], ast.Assign)
-        and len(node.body[0].targets) == 1
-        and isinstance(node.body[0].value, ast.Subscript)
+    test = node.test
+    if not (
+        type(test) is ast.Compare
+        and len(test.ops) == 1
+        and len(node.body) == 1
         and len(node.orelse) == 1
-        and isinstance(node.orelse[0], ast.Assign)
-        and len(node.orelse[0].targets) == 1
-        and isinstance(node.test, ast.Compare)
-        and len(node.test.ops) == 1
-        and isinstance(node.test.ops[0], ast.In)
-    )
+    ):
+        return errors
+    if_assign = node.body[0]
+    else_assign = node.orelse[0]
+    if not (type(if_assign) is ast.Assign and type(else_assign) is ast.Assign):
+        return errors
 
-    # just like pattern_1, but using NotIn and reversing if/else
-    is_pattern_2 = (
-        len(node.body) == 1
-        and isinstance(node.body[0], ast.Assign)
-        and len(node.orelse) == 1
-        and isinstance(node.orelse[0], ast.Assign)
-        and isinstance(node.orelse[0].value, ast.Subscript)
-        and isinstance(node.test, ast.Compare)
-        and len(node.test.ops) == 1
-        and isinstance(node.test.ops[0], ast.NotIn)
-    )
-    if is_pattern_1:
-        assert isinstance(node.test, ast.Compare)
-        assert isinstance(node.body[0], ast.Assign)
-        assert isinstance(node.body[0].value, ast.Subscript)
-        assert isinstance(node.orelse[0], ast.Assign)
-        key = node.test.left
-        if to_source(key) != to_source(node.body[0].value.slice):
-            return errors  # second part of pattern 1
-        assign_to_if_body = node.body[0].targets[0]
-        assign_to_else = node.orelse[0].targets[0]
-        if to_source(assign_to_if_body) != to_source(assign_to_else):
+    # Both patterns only differ in the operator, so check it first
+    op = type(test.ops[0])
+    if op is ast.In:
+        # Pattern 1
+        if not (
+            len(if_assign.targets) == 1
+            and type(if_assign.value) is ast.Subscript
+            and len(else_assign.targets) == 1
+        ):
+            return errors
+        subscript = if_assign.value
+        default_value = else_assign.value
+        if to_source(if_assign.targets[0]) != to_source(
+            else_assign.targets[0]
+        ):
+            return errors
+    elif op is ast.NotIn:
+        # Pattern 2: like pattern 1, but using NotIn and reversing if/else
+        if type(else_assign.value) is not ast.Subscript:
             return errors
-        dict_name = node.test.comparators[0]
-        default_value = node.orelse[0].value
-        value_node = node.body[0].targets[0]
-        key_str = to_source(key)
-        dict_str = to_source(dict_name)
-        default_str = to_source(default_value)
-        value_str = to_source(value_node)
-    elif is_pattern_2:
-        assert isinstance(node.test, ast.Compare)
-        assert isinstance(node.body[0], ast.Assign)
-        assert isinstance(node.orelse[0], ast.Assign)
-        assert isinstance(node.orelse[0].value, ast.Subscript)
-        key = node.test.left
-        if to_source(key) != to_source(node.orelse[0].value.slice):
-            return errors  # second part of pattern 1
-        dict_name = node.test.comparators[0]
-        default_value = node.body[0].value
-        value_node = node.body[0].targets[0]
-        key_str = to_source(key)
-        dict_str = to_source(dict_name)
-        default_str = to_source(default_value)
-        value_str = to_source(value_node)
+        subscript = else_assign.value
+        default_value = if_assign.value
     else:
         return errors
+
+    key_str = to_source(test.left)
+    if key_str != to_source(subscript.slice):
+        return errors  # second part of the pattern
+    dict_str = to_source(test.comparators[0])
+    default_str = to_source(default_value)
+    value_str = to_source(if_assign.targets[0])
     errors.append(
         (
             node.lineno,
             node.col_offset,
-            SIM401.format(
-                key=key_str,
-                dict=dict_str,
-                default_value=default_str,
-                value=value_str,
-            ),
+            f"SIM401 Use '{value_str} = {dict_str}.get({key_str}, "
+            f"{default_str})' instead of an if-block",
         )
     )
     return errors
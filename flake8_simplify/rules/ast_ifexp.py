@@ -3,7 +3,6 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.constants import BOOL_CONST_TYPES
 from flake8_simplify.utils import is_same_expression, to_source
 
 
@@ -11,11 +10,13 @@ def get_sim210(node: ast.IfExp) -> List[Tuple[int, int, str]]:
     """Get a list of all calls of the type "True if a else False"."""
     SIM210 = "SIM210 Use 'bool({cond})' instead of 'True if {cond} else False'"
     errors: List[Tuple[int, int, str]] = []
-    if (
-        not isinstance(node.body, BOOL_CONST_TYPES)
-        or node.body.value is not True
-        or not isinstance(node.orelse, BOOL_CONST_TYPES)
-        or node.orelse.value is not False
+    body = node.body
+    orelse = node.orelse
+    if not (
+        type(body) is ast.Constant
+        and body.value is True
+        and type(orelse) is ast.Constant
+        and orelse.value is False
     ):
         return errors
     cond = to_source(node.test)
@@ -27,11 +28,13 @@ def get_sim211(node: ast.IfExp) -> List[Tuple[int, int, str]]:
     """Get a list of all calls of the type "False if a else True"."""
     SIM211 = "SIM211 Use 'not {cond}' instead of 'False if {cond} else True'"
     errors: List[Tuple[int, int, str]] = []
-    if (
-        not isinstance(node.body, BOOL_CONST_TYPES)
-        or node.body.value is not False
-        or not isinstance(node.orelse, BOOL_CONST_TYPES)
-        or node.orelse.value is not True
+    body = node.body
+    orelse = node.orelse
+    if not (
+        type(body) is ast.Constant
+        and body.value is False
+        and type(orelse) is ast.Constant
+        and orelse.value is True
     ):
         return errors
     cond = to_source(node.test)
@@ -57,8 +60,8 @@ def get_sim212(node: ast.IfExp) -> List[Tuple[int, int, str]]:
     )
     errors: List[Tuple[int, int, str]] = []
     if not (
-        isinstance(node.test, ast.UnaryOp)
-        and isinstance(node.test.op, ast.Not)
+        type(node.test) is ast.UnaryOp
+        and type(node.test.op) is ast.Not
         and is_same_expression(node.test.operand, node.orelse)
     ):
         return errors
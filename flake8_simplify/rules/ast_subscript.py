@@ -1,11 +1,30 @@
 # Core Library
 import ast
-from typing import List, Tuple
+import sys
+from typing import List, Optional, Tuple
 
 # First party
-from flake8_simplify.constants import BOOL_CONST_TYPES
+from flake8_simplify.constants import is_none_constant
 from flake8_simplify.utils import to_source
 
+if sys.version_info < (3, 9):  # pragma: no cover (<PY39)
+
+    def _get_tuple_slice(node: ast.Subscript) -> Optional[ast.Tuple]:
+        """Get the tuple in 'node[a, b]', wrapped in ast.Index before 3.9."""
+        if isinstance(node.slice, ast.Index) and isinstance(
+            node.slice.value, ast.Tuple  # type: ignore
+        ):
+            return node.slice.value  # type: ignore
+        return None
+
+else:  # pragma: no cover (PY39+)
+
+    def _get_tuple_slice(node: ast.Subscript) -> Optional[ast.Tuple]:
+        """Get the tuple in 'node[a, b]'."""
+        if type(node.slice) is ast.Tuple:
+            return node.slice
+        return None
+
 
 def get_sim907(node: ast.Subscript) -> List[Tuple[int, int, str]]:
     """
@@ -24,36 +43,33 @@ def get_sim907(node: ast.Subscript) -> List[Tuple[int, int, str]]:
     """
     errors: List[Tuple[int, int, str]] = []
 
-    if not (isinstance(node.value, ast.Name) and node.value.id == "Union"):
+    if not (type(node.value) is ast.Name and node.value.id == "Union"):
         return errors
 
-    if isinstance(node.slice, ast.Index) and isinstance(
-        node.slice.value, ast.Tuple  # type: ignore
-    ):
-        # Python 3.8
-        tuple_var = node.slice.value  # type: ignore
-    elif isinstance(node.slice, ast.Tuple):
-        # Python 3.9+
-        tuple_var = node.slice
-    else:
+    tuple_var = _get_tuple_slice(node)
+    if tuple_var is None:
         return errors
 
     has_none = False
-    others = []
-    for elt in tuple_var.elts:  # type: ignore
-        if isinstance(elt, BOOL_CONST_TYPES) and elt.value is None:
+    other: Optional[ast.expr] = None
+    for elt in tuple_var.elts:
+        if is_none_constant(elt):
             has_none = True
+        elif other is None:
+            other = elt
         else:
-            others.append(elt)
+            # More than one type besides None
+            return errors
+    if not has_none or other is None:
+        return errors
 
     RULE = "SIM907 Use 'Optional[{type_}]' instead of '{original}'"
-    if len(others) == 1 and has_none:
-        type_ = to_source(others[0])
-        errors.append(
-            (
-                node.lineno,
-                node.col_offset,
-                RULE.format(type_=type_, original=to_source(node)),
-            )
+    type_ = to_source(other)
+    errors.append(
+        (
+            node.lineno,
+            node.col_offset,
+            RULE.format(type_=type_, original=to_source(node)),
         )
+    )
     return errors
@@ -45,9 +45,9 @@ def get_sim105(node: ast.Try) -> List[Tuple[int, int, str]]:
     if (
         len(node.body) != 1
         or len(node.handlers) != 1
-        or not isinstance(node.handlers[0], ast.ExceptHandler)
+        or type(node.handlers[0]) is not ast.ExceptHandler
         or len(node.handlers[0].body) != 1
-        or not isinstance(node.handlers[0].body[0], ast.Pass)
+        or type(node.handlers[0].body[0]) is not ast.Pass
         or node.orelse != []
     ):
         return errors
@@ -68,28 +68,20 @@ def get_sim107(node: ast.Try) -> List[Tuple[int, int, str]]:
     SIM107 = "SIM107 Don't use return in try/except and finally"
     errors: List[Tuple[int, int, str]] = []
 
-    try_has_return = False
-    for stmt in node.body:
-        if isinstance(stmt, ast.Return):
-            try_has_return = True
-            break
-
-    except_has_return = False
-    for stmt2 in node.handlers:
-        if isinstance(stmt2, ast.Return):
-            except_has_return = True
-            break
-
-    finally_has_return = False
-    finally_return = None
-    for stmt in node.finalbody:
-        if isinstance(stmt, ast.Return):
-            finally_has_return = True
-            finally_return = stmt
-            break
+    finally_return = next(
+        (stmt for stmt in node.finalbody if type(stmt) is ast.Return),
+        None,
+    )
+    if finally_return is None:
+        return errors
 
-    if (try_has_return or except_has_return) and finally_has_return:
-        assert finally_return is not None, "hint for mypy"
+    try_has_return = any(type(stmt) is ast.Return for stmt in node.body)
+    except_has_return = any(
+        type(stmt) is ast.Return
+        for handler in node.handlers
+        for stmt in handler.body
+    )
+    if try_has_return or except_has_return:
         errors.append(
             (finally_return.lineno, finally_return.col_offset, SIM107)
         )
@@ -3,89 +3,45 @@ import ast
 from typing import List, Tuple
 
 # First party
-from flake8_simplify.utils import UnaryOp, is_exception_check, to_source
+from flake8_simplify.utils import is_exception_check, to_source
 
-
-def get_sim201(node: UnaryOp) -> List[Tuple[int, int, str]]:
-    """
-    Get a list of all calls where an unary 'not' is used for an equality.
-    """
-    SIM201 = (
+# Messages of SIM201 to SIM203 by the type of the negated comparison
+SIM201_SIM203 = {
+    ast.Eq: (
         "SIM201 Use '{left} != {right}' instead of 'not {left} == {right}'"
-    )
-    errors: List[Tuple[int, int, str]] = []
-    if (
-        (
-            not isinstance(node.op, ast.Not)
-            or not isinstance(node.operand, ast.Compare)
-            or len(node.operand.ops) != 1
-            or not isinstance(node.operand.ops[0], ast.Eq)
-        )
-        or isinstance(node.parent, ast.If)
-        and is_exception_check(node.parent)
-    ):
-        return errors
-    comparison = node.operand
-    left = to_source(comparison.left)
-    right = to_source(comparison.comparators[0])
-    errors.append(
-        (node.lineno, node.col_offset, SIM201.format(left=left, right=right))
-    )
-
-    return errors
-
-
-def get_sim202(node: UnaryOp) -> List[Tuple[int, int, str]]:
-    """
-    Get a list of all calls where an unary 'not' is used for an quality.
-    """
-    SIM202 = (
+    ),
+    ast.NotEq: (
         "SIM202 Use '{left} == {right}' instead of 'not {left} != {right}'"
-    )
-    errors: List[Tuple[int, int, str]] = []
-    if (
-        (
-            not isinstance(node.op, ast.Not)
-            or not isinstance(node.operand, ast.Compare)
-            or len(node.operand.ops) != 1
-            or not isinstance(node.operand.ops[0], ast.NotEq)
-        )
-        or isinstance(node.parent, ast.If)
-        and is_exception_check(node.parent)
-    ):
-        return errors
-    comparison = node.operand
-    left = to_source(comparison.left)
-    right = to_source(comparison.comparators[0])
-    errors.append(
-        (node.lineno, node.col_offset, SIM202.format(left=left, right=right))
-    )
-
-    return errors
+    ),
+    ast.In: (
+        "SIM203 Use '{left} not in {right}' instead of "
+        "'not {left} in {right}'"
+    ),
+}
 
 
-def get_sim203(node: UnaryOp) -> List[Tuple[int, int, str]]:
+def get_sim201_sim203(node: ast.UnaryOp) -> List[Tuple[int, int, str]]:
     """
-    Get a list of all calls where an unary 'not' is used for an in-check.
+    Get a list of all calls where an unary 'not' is used for a comparison.
+
+    SIM201 is for '==', SIM202 for '!=' and SIM203 for 'in'.
     """
-    SIM203 = "SIM203 Use '{a} not in {b}' instead of 'not {a} in {b}'"
     errors: List[Tuple[int, int, str]] = []
     if (
-        (
-            not isinstance(node.op, ast.Not)
-            or not isinstance(node.operand, ast.Compare)
-            or len(node.operand.ops) != 1
-            or not isinstance(node.operand.ops[0], ast.In)
-        )
-        or isinstance(node.parent, ast.If)
-        and is_exception_check(node.parent)
+        type(node.op) is not ast.Not
+        or type(node.operand) is not ast.Compare
+        or len(node.operand.ops) != 1
     ):
         return errors
+    rule = SIM201_SIM203.get(type(node.operand.ops[0]))
+    parent = node.parent  # type: ignore
+    if rule is None or (type(parent) is ast.If and is_exception_check(parent)):
+        return errors
     comparison = node.operand
     left = to_source(comparison.left)
     right = to_source(comparison.comparators[0])
     errors.append(
-        (node.lineno, node.col_offset, SIM203.format(a=left, b=right))
+        (node.lineno, node.col_offset, rule.format(left=left, right=right))
     )
 
     return errors
@@ -96,9 +52,9 @@ def get_sim208(node: ast.UnaryOp) -> List[Tuple[int, int, str]]:
     SIM208 = "SIM208 Use '{a}' instead of 'not (not {a})'"
     errors: List[Tuple[int, int, str]] = []
     if (
-        not isinstance(node.op, ast.Not)
-        or not isinstance(node.operand, ast.UnaryOp)
-        or not isinstance(node.operand.op, ast.Not)
+        type(node.op) is not ast.Not
+        or type(node.operand) is not ast.UnaryOp
+        or type(node.operand.op) is not ast.Not
     ):
         return errors
     a = to_source(node.operand.operand)
@@ -1,6 +1,6 @@
 # Core Library
 import ast
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # First party
 from flake8_simplify.utils import to_source
@@ -50,11 +50,21 @@ def get_sim117(node: ast.With) -> List[Tuple[int, int, str]]:
     """
     SIM117 = "SIM117 Use '{merged_with}' instead of multiple with statements"
     errors: List[Tuple[int, int, str]] = []
-    if not (len(node.body) == 1 and isinstance(node.body[0], ast.With)):
+    if len(node.body) != 1 or type(node.body[0]) is not ast.With:
         return errors
-    with_items = []
-    for withitem in node.items + node.body[0].items:
-        with_items.append(f"{to_source(withitem)}")
+    # A nested chain is reported once, at its outermost with-statement
+    parent = getattr(node, "parent", None)
+    if (
+        type(parent) is ast.With
+        and len(parent.body) == 1
+        and parent.body[0] is node
+    ):
+        return errors
+    with_items: List[str] = []
+    inner: Optional[ast.stmt] = node
+    while type(inner) is ast.With:
+        with_items += [to_source(withitem) for withitem in inner.items]
+        inner = inner.body[0] if len(inner.body) == 1 else None
     merged_with = f"with {', '.join(with_items)}:"
     errors.append(
         (node.lineno, node.col_offset, SIM117.format(merged_with=merged_with))
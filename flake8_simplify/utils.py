@@ -1,99 +1,139 @@
 # Core Library
 import ast
-import itertools
-from collections import defaultdict
-from typing import DefaultDict, List, Tuple, Union
+import io
+import sys
+import tokenize
+from typing import Any, Dict, List, Tuple, Union
 
-# Third party
-import astor
+if sys.version_info < (3, 9):  # pragma: no cover (<PY39)
+    # Third party
+    import astor
 
+    def unparse(node: ast.AST) -> str:
+        """Get the source code of the node."""
+        return astor.to_source(node)
 
-# The following types were created to help mypy understand that there is a
-# "parent" attribute on the ast.AST nodes.
-class UnaryOp(ast.UnaryOp):
-    def __init__(self, orig: ast.UnaryOp) -> None:
-        self.op = orig.op
-        self.operand = orig.operand
-        # For all ast.*:
-        self.lineno = orig.lineno
-        self.col_offset = orig.col_offset
-        self.parent: ast.Expr = orig.parent  # type: ignore
+else:  # pragma: no cover (PY39+)
 
+    def unparse(node: ast.AST) -> str:
+        """Get the source code of the node."""
+        return ast.unparse(node)
 
-class Call(ast.Call):
-    """For mypy so that it knows that added attributes exist."""
 
-    def __init__(self, orig: ast.Call) -> None:
-        self.func = orig.func
-        self.args = orig.args
-        self.keywords = orig.keywords
-        # For all ast.*:
-        self.lineno = orig.lineno
-        self.col_offset = orig.col_offset
+# Maps id(node) to (node, source). The node is kept so that its id cannot be
+# reused by another node while the entry exists.
+_source_cache: Dict[int, Tuple[ast.AST, str]] = {}
 
-        # Added attributes
-        self.parent: ast.Expr = orig.parent  # type: ignore
 
+def reset_to_source_cache() -> None:
+    """Forget all sources computed by to_source, e.g. for a new file."""
+    _source_cache.clear()
 
-class If(ast.If):
-    """For mypy so that it knows that added attributes exist."""
 
-    def __init__(self, orig: ast.If) -> None:
-        self.test = orig.test
-        self.body = orig.body
-        self.orelse = orig.orelse
-
-        # For all ast.*:
-        self.lineno = orig.lineno
-        self.col_offset = orig.col_offset
-
-        # Added attributes
-        self.parent: ast.Expr = orig.parent  # type: ignore
-
-
-class For(ast.For):
-    """For mypy so that it knows that added attributes exist."""
-
-    def __init__(self, orig: ast.For) -> None:
-        self.target = orig.target
-        self.iter = orig.iter
-        self.body = orig.body
-        self.orelse = orig.orelse
-        # For all ast.*:
-        self.lineno = orig.lineno
-        self.col_offset = orig.col_offset
+def to_source(
+    node: Union[None, ast.expr, ast.Expr, ast.withitem, ast.slice, ast.Assign]
+) -> str:
+    if node is None:
+        return "None"
+    # Shortcuts for the most common trivial nodes; unparse gives the same
+    if type(node) is ast.Name:
+        return node.id
+    if type(node) is ast.Attribute and type(node.value) is ast.Name:
+        return f"{node.value.id}.{node.attr}"
+    if type(node) is ast.Constant:
+        value = node.value
+        if value is None or type(value) in (bool, int):
+            return repr(value)
+        if (
+            type(value) is str
+            and value.isprintable()
+            and "'" not in value
+            and '"' not in value
+            and "\\" not in value
+        ):
+            return f'"{value}"'
+    cached = _source_cache.get(id(node))
+    if cached is not None and cached[0] is node:
+        return cached[1]
+    source = normalize_source(unparse(node).strip())
+    _source_cache[id(node)] = (node, source)
+    return source
 
-        # Added attributes
-        self.parent: ast.AST = orig.parent  # type: ignore
-        self.previous_sibling = orig.previous_sibling  # type: ignore
 
+def normalize_source(string: str) -> str:
+    """
+    Apply the strip_* helpers and use_double_quotes to unparsed source.
 
-class Assign(ast.Assign):
-    """For mypy so that it knows that added attributes exist."""
+    Only one of the quote helpers can change the string, depending on its
+    first character, so the other one is not called.
+    """
+    string = strip_parenthesis(strip_generator_parenthesis(string))
+    first = string[:1]
+    if first == '"':
+        return strip_triple_quotes(string)
+    if first == "'":
+        return use_double_quotes(string)
+    return string
 
-    def __init__(self, orig: ast.Assign) -> None:
-        self.targets = orig.targets
-        self.value = orig.value
-        # For all ast.*:
-        self.orig = orig
-        self.lineno = orig.lineno
-        self.col_offset = orig.col_offset
 
-        # Added attributes
-        self.parent: ast.AST = orig.parent  # type: ignore
-        self.previous_sibling = orig.previous_sibling  # type: ignore
+def strip_generator_parenthesis(string: str) -> str:
+    """
+    Remove the parentheses around generators which are the only argument.
 
+    ast.unparse gives "all((x for x in y))", astor gives "all(x for x in y)".
+    """
+    # Cheap check first, this is called for every unparsed node
+    if "((" not in string:
+        return string
+    try:
+        tokens = [
+            token
+            for token in tokenize.generate_tokens(io.StringIO(string).readline)
+            if token.type == tokenize.OP or token.string == "for"
+        ]
+    except (tokenize.TokenError, SyntaxError):
+        return string
 
-def to_source(
-    node: Union[None, ast.expr, ast.Expr, ast.withitem, ast.slice, ast.Assign]
-) -> str:
-    if node is None:
-        return "None"
-    source: str = astor.to_source(node).strip()
-    source = strip_parenthesis(source)
-    source = strip_triple_quotes(source)
-    source = use_double_quotes(source)
-    return source
+    # Index of the matching closing bracket for every opening one
+    closing: Dict[int, int] = {}
+    stack: List[int] = []
+    for index, token in enumerate(tokens):
+        if token.string in "([{":
+            stack.append(index)
+        elif token.string in ")]}" and stack:
+            closing[stack.pop()] = index
+
+    line_starts = [0]
+    for line in string.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+    remove = set()
+    for outer, outer_end in closing.items():
+        inner = outer + 1
+        if not (
+            tokens[outer].string == "("
+            and tokens[inner].string == "("
+            and tokens[inner].start == tokens[outer].end
+            and closing.get(inner) == outer_end - 1
+            and tokens[outer_end].start == tokens[outer_end - 1].end
+        ):
+            continue
+        # Only a generator has a "for" directly within the parentheses
+        depth = 0
+        for token in tokens[inner + 1 : outer_end - 1]:
+            if token.string in "([{":
+                depth += 1
+            elif token.string in ")]}":
+                depth -= 1
+            elif depth == 0 and token.string == "for":
+                break
+        else:
+            continue
+        for token in (tokens[inner], tokens[outer_end - 1]):
+            row, col = token.start
+            remove.add(line_starts[row - 1] + col)
+    return "".join(
+        char for offset, char in enumerate(string) if offset not in remove
+    )
 
 
 def strip_parenthesis(string: str) -> str:
@@ -139,73 +179,74 @@ def is_body_same(body1: List[ast.stmt], body2: List[ast.stmt]) -> bool:
     return True
 
 
-def is_stmt_equal(a: ast.stmt, b: ast.stmt) -> bool:
-    if type(a) is not type(b):
+def is_stmt_equal(a: Any, b: Any) -> bool:
+    """Compare two AST nodes, lists of nodes or field values structurally."""
+    node_type = type(a)
+    if node_type is not type(b):
         return False
+    # Shortcuts for the most common leaves
+    if node_type is ast.Name:
+        return a.id == b.id  # type: ignore
+    if node_type is ast.Constant:
+        return type(a.value) is type(b.value) and a.value == b.value
     if isinstance(a, ast.AST):
-        specials = (
-            "lineno",
-            "col_offset",
-            "ctx",
-            "end_lineno",
-            "parent",
-            "previous_sibling",
-            "next_sibling",
-        )
-        for k, v in vars(a).items():
-            if k.startswith("_") or k in specials:
-                continue
-            if not is_stmt_equal(v, getattr(b, k)):
+        # Only the fields, not the positions or the attributes of add_meta
+        for field in node_type._fields:  # noqa: SIM111
+            if not is_stmt_equal(
+                getattr(a, field, None), getattr(b, field, None)
+            ):
                 return False
         return True
     elif isinstance(a, list):
         if len(a) != len(b):
             return False
-        return all(itertools.starmap(is_stmt_equal, zip(a, b)))
+        # A plain loop is faster than all() here, this is the hot path
+        for a_elem, b_elem in zip(a, b):  # noqa: SIM111
+            if not is_stmt_equal(a_elem, b_elem):
+                return False
+        return True
     else:
-        return a == b
+        return a == b  # type: ignore
 
 
 def get_if_body_pairs(node: ast.If) -> List[Tuple[ast.expr, List[ast.stmt]]]:
     pairs = [(node.test, node.body)]
+    # ast.If.orelse is always a list, empty if there is no else-branch
     orelse = node.orelse
-    while (
-        isinstance(orelse, list)
-        and len(orelse) == 1
-        and isinstance(orelse[0], ast.If)
-    ):
-        pairs.append((orelse[0].test, orelse[0].body))
-        orelse = orelse[0].orelse
+    while len(orelse) == 1 and type(orelse[0]) is ast.If:
+        elif_node = orelse[0]
+        pairs.append((elif_node.test, elif_node.body))
+        orelse = elif_node.orelse
     return pairs
 
 
 def is_constant_increase(expr: ast.AugAssign) -> bool:
-    return isinstance(expr.op, ast.Add) and (
-        (isinstance(expr.value, ast.Constant) and expr.value.value == 1)
-        or (isinstance(expr.value, ast.Num) and expr.value.n == 1)
+    return (
+        type(expr.op) is ast.Add
+        and type(expr.value) is ast.Constant
+        and expr.value.value == 1
     )
 
 
 def is_exception_check(node: ast.If) -> bool:
-    if len(node.body) == 1 and isinstance(node.body[0], ast.Raise):
+    if len(node.body) == 1 and type(node.body[0]) is ast.Raise:
         return True
     return False
 
 
 def is_same_expression(a: ast.expr, b: ast.expr) -> bool:
     """Check if two expressions are equal to each other."""
-    if isinstance(a, ast.Name) and isinstance(b, ast.Name):
+    if type(a) is ast.Name and type(b) is ast.Name:
         return a.id == b.id
     else:
         return False
 
 
 def expression_uses_variable(expr: ast.expr, var: str) -> bool:
-    if var in to_source(expr):
-        # This is WAY too broad, but it's better to have false-negatives
-        # than false-positives
-        return True
-    return False
+    """Check if the variable 'var' is read anywhere within the expression."""
+    return any(
+        type(node) is ast.Name and node.id == var for node in ast.walk(expr)
+    )
 
 
 def _get_duplicated_isinstance_call_by_node(node: ast.BoolOp) -> List[str]:
@@ -222,26 +263,23 @@ def _get_duplicated_isinstance_call_by_node(node: ast.BoolOp) -> List[str]:
     >> g("isinstance(a, int) or isinstance(b, float) or isinstance(b, int)
     ['b']
     """
-    counter: DefaultDict[str, int] = defaultdict(int)
-
+    seen = set()
+    duplicates: List[str] = []
     for call in node.values:
         # Make sure that this function call is actually a call of the built-in
         # "isinstance"
-        if not isinstance(call, ast.Call) or len(call.args) != 2:
-            continue
-        function_name = to_source(call.func)
-        if function_name != "isinstance":
+        if not (
+            type(call) is ast.Call
+            and len(call.args) == 2
+            and type(call.func) is ast.Name
+            and call.func.id == "isinstance"
+        ):
             continue
 
         # Collect the name of the argument
         isinstance_arg0_name = to_source(call.args[0])
-        counter[isinstance_arg0_name] += 1
-    return [arg0_name for arg0_name, count in counter.items() if count > 1]
-
-
-def body_contains_continue(stmts: List[ast.stmt]) -> bool:
-    return any(
-        isinstance(stmt, ast.Continue)
-        or (isinstance(stmt, ast.If) and body_contains_continue(stmt.body))
-        for stmt in stmts
-    )
+        if isinstance_arg0_name not in seen:
+            seen.add(isinstance_arg0_name)
+        elif isinstance_arg0_name not in duplicates:
+            duplicates.append(isinstance_arg0_name)
+    return duplicates
@@ -1,13 +1,22 @@
 # Core Library
 import ast
-from typing import Set
+import functools
+from typing import FrozenSet
 
 # First party
 from flake8_simplify import Plugin
 
 
-def _results(code: str) -> Set[str]:
-    """Apply the plugin to the given code."""
+@functools.lru_cache(maxsize=None)
+def _results(code: str) -> FrozenSet[str]:
+    """
+    Apply the plugin to the given code.
+
+    The plugin is deterministic, so the result is cached by the code. This
+    saves parsing and checking the snippets which several tests share.
+    """
     tree = ast.parse(code)
     plugin = Plugin(tree)
-    return {f"{line}:{col} {msg}" for line, col, msg, _ in plugin.run()}
+    return frozenset(
+        f"{line}:{col} {msg}" for line, col, msg, _ in plugin.run()
+    )
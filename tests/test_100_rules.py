@@ -1,10 +1,13 @@
 # Core Library
+import ast
+import textwrap
 from typing import Iterable
 
 # Third party
 import pytest
 
 # First party
+from flake8_simplify import Plugin
 from tests import _results
 
 
@@ -144,6 +147,19 @@ def test_sim107():
     assert ret == {"8:8 SIM107 Don't use return in try/except and finally"}
 
 
+def test_sim107_return_in_except():
+    ret = _results(
+        """def foo():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        return "2"
+    finally:
+        return "3" """
+    )
+    assert ret == {"7:8 SIM107 Don't use return in try/except and finally"}
+
+
 def test_sim108():
     ret = _results(
         """if a:
@@ -158,6 +174,30 @@ else:
     assert ret == {exp}
 
 
+@pytest.mark.parametrize(
+    ("orelse", "expected"),
+    (
+        (
+            "dd",
+            {
+                "1:0 SIM108 Use ternary operator "
+                "'bb = cccc if aaa else dd' instead of if-else-block"
+            },
+        ),
+        ("ddd", set()),
+    ),
+    ids=("79-characters", "80-characters"),
+)
+def test_sim108_max_length(orelse, expected):
+    ret = _results(
+        f"""if aaa:
+    bb = cccc
+else:
+    bb = {orelse}"""
+    )
+    assert ret == expected
+
+
 def test_sim108_false_positive():
     ret = _results(
         """if E == 0:
@@ -210,6 +250,19 @@ return False"""
     assert ret == {"1:0 SIM110 Use 'return any(check(x) for x in iterable)'"}
 
 
+def test_sim110_any_generator_argument():
+    ret = _results(
+        """for mark in matches:
+    if all(mark.kwargs.get(k) == v for k, v in kwargs.items()):
+        return True
+return False"""
+    )
+    assert ret == {
+        "1:0 SIM110 Use 'return any(all(mark.kwargs.get(k) == v for k, v "
+        "in kwargs.items()) for mark in matches)'"
+    }
+
+
 def test_sim110_raise_exception():
     ret = _results(
         """
@@ -362,6 +415,23 @@ def test_sim113_false_positive(s):
     assert ret == set()
 
 
+@pytest.mark.parametrize(
+    ("code", "reported"),
+    (
+        ("continue", False),
+        ("if a:\n    b()\n    if c:\n        continue", False),
+        ("if a:\n    pass\nelse:\n    continue", True),
+        ("x = 1", True),
+    ),
+)
+def test_sim113_continue(code, reported):
+    body = textwrap.indent(f"{code}\nidx += 1", "    ")
+    ret = _results(f"idx = 0\nfor x in y:\n{body}")
+    assert ret == (
+        {"1:0 SIM113 Use enumerate for 'idx'"} if reported else set()
+    )
+
+
 def test_sim114():
     ret = _results(
         """if a:
@@ -372,6 +442,42 @@ elif c:
     assert ret == {"1:3 SIM114 Use logical or ((a) or (c)) and a single body"}
 
 
+def test_sim114_different_formatting():
+    ret = _results(
+        """if a:
+    x = 1
+elif c:
+    x  =  1"""
+    )
+    assert ret == {"1:3 SIM114 Use logical or ((a) or (c)) and a single body"}
+
+
+def test_sim114_false_positive_equal_constants_of_other_type():
+    ret = _results(
+        """if a:
+    x = 1
+elif c:
+    x = True"""
+    )
+    assert ret == set()
+
+
+def test_sim114_elif_chain_reported_once():
+    tree = ast.parse(
+        """if a:
+    b
+elif c:
+    b
+elif d:
+    b"""
+    )
+    ret = [(line, col, msg) for line, col, msg, _ in Plugin(tree).run()]
+    assert ret == [
+        (1, 3, "SIM114 Use logical or ((a) or (c)) and a single body"),
+        (3, 5, "SIM114 Use logical or ((c) or (d)) and a single body"),
+    ]
+
+
 def test_sim114_false_positive70():
     ret = _results(
         """def complicated_calc(*arg, **kwargs):
@@ -441,6 +547,22 @@ else:
     }
 
 
+def test_sim116_int_values():
+    ret = _results(
+        """if a == 1:
+    return 10
+elif a == 2:
+    return 20
+elif a == 3:
+    return 30"""
+    )
+    assert ret == {
+        "1:0 SIM116 Use a dictionary lookup "
+        "instead of 3+ if/elif-statements: "
+        "return {1: 10, 2: 20, 3: 30}.get(a)"
+    }
+
+
 def test_sim116_false_positive():
     ret = _results(
         """if a == "foo":
@@ -468,6 +590,19 @@ def test_sim117():
     }
 
 
+def test_sim117_three_levels():
+    ret = _results(
+        """with A() as a:
+    with B() as b:
+        with C() as c:
+            print('hello')"""
+    )
+    assert ret == {
+        "1:0 SIM117 Use 'with A() as a, B() as b, C() as c:' "
+        "instead of multiple with statements"
+    }
+
+
 def test_sim117_no_trigger_begin():
     ret = _results(
         """with A() as a:
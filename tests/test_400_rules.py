@@ -67,17 +67,12 @@ def test_sim401_positive_msg_issue84_example1():
 else:
     name = test_dict["first_name"]"""
     )
-    has_sim401 = False
     expected_proposal = (
         'Use \'name = test_dict.get("last_name", '
         "test_dict['first_name'])' instead of an if-block"
     )
-    for el in ret:
-        if "SIM401" in el:
-            msg = el.split("SIM401")[1].strip()
-            has_sim401 = True
-            assert msg == expected_proposal
-    assert has_sim401
+    messages = [el.split("SIM401")[1].strip() for el in ret if "SIM401" in el]
+    assert messages == [expected_proposal]
 
 
 def test_sim401_positive_msg_issue84_example2():
@@ -92,17 +87,12 @@ def test_sim401_positive_msg_issue84_example2():
 else:
     number = "" """
     )
-    has_sim401 = False
     expected_proposal = (
         'Use \'number = test_dict.get("phone_number", "")\' '
         "instead of an if-block"
     )
-    for el in ret:
-        if "SIM401" in el:
-            msg = el.split("SIM401")[1].strip()
-            has_sim401 = True
-            assert msg == expected_proposal
-    assert has_sim401
+    messages = [el.split("SIM401")[1].strip() for el in ret if "SIM401" in el]
+    assert messages == [expected_proposal]
 
 
 def test_sim401_positive_msg_check_issue89():
@@ -119,13 +109,8 @@ elif 'token' in dct:
 else:
     token = None"""
     )
-    has_sim401 = False
     expected_proposal = (
         "Use 'token = dct.get(\"token\", None)' instead of an if-block"
     )
-    for el in ret:
-        if "SIM401" in el:
-            msg = el.split("SIM401")[1].strip()
-            has_sim401 = True
-            assert msg == expected_proposal
-    assert has_sim401
+    messages = [el.split("SIM401")[1].strip() for el in ret if "SIM401" in el]
+    assert messages == [expected_proposal]
@@ -15,11 +15,8 @@ def test_sim901():
     (
         """a = { }
 a['b'] = 'c'""",
-        pytest.param(
-            """a = { }
+        """a = { }
 a['b'] = ba""",
-            marks=pytest.mark.xfail,
-        ),
     ),
     ids=["minimal", "contains-name"],
 )
@@ -64,6 +61,18 @@ def test_sim905():
     }
 
 
+def test_sim905_escaped():
+    results = _results(r"""domains = "de\\com net".split()""")
+    assert results == {
+        r"""1:10 SIM905 Use '["de\\com", "net"]' """
+        r"""instead of '"de\\com net".split()'"""
+    }
+
+
+def test_sim905_bytes():
+    assert _results("""domains = b"de com".split()""") == set()
+
+
 @pytest.mark.parametrize(
     ("s", "msg"),
     (
@@ -79,8 +88,14 @@ def test_sim905():
             "1:0 SIM906 Use 'os.path.join(a, 'b', c)' "
             "instead of 'os.path.join(a, os.path.join('b', c))'",
         ),
+        (
+            "os.path.join(os.path.join(a,b),os.path.join(c,d))",
+            "1:0 SIM906 Use 'os.path.join(a, b, c, d)' "
+            "instead of 'os.path.join(os.path.join(a, b), "
+            "os.path.join(c, d))'",
+        ),
     ),
-    ids=["base", "str-arg"],
+    ids=["base", "str-arg", "nested-both"],
 )
 def test_sim906(s, msg):
     results = _results(s)
@@ -97,6 +112,14 @@ def test_sim907():
     }
 
 
+def test_sim907_multiple_types():
+    results = _results(
+        """def foo(a: Union[int, str, None]) -> bool:
+  return a"""
+    )
+    assert results == set()
+
+
 def test_sim908():
     results = _results(
         """name = "some_default"
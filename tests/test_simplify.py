@@ -1,9 +1,27 @@
 # Core Library
+import argparse
 import ast
+import sys
+
+# Third party
+import pytest
 
 # First party
-from flake8_simplify import Plugin
-from flake8_simplify.utils import get_if_body_pairs
+import flake8_simplify.utils
+from flake8_simplify import Plugin, _rule_codes
+from flake8_simplify.rules.ast_if import get_sim102
+from flake8_simplify.rules.ast_unary_op import get_sim201_sim203
+from flake8_simplify.utils import (
+    get_if_body_pairs,
+    normalize_source,
+    reset_to_source_cache,
+    strip_generator_parenthesis,
+    strip_parenthesis,
+    strip_triple_quotes,
+    to_source,
+    unparse,
+    use_double_quotes,
+)
 from tests import _results
 
 
@@ -70,45 +88,135 @@ def test_multiple_other_function():
     assert ret == set()
 
 
-def test_get_if_body_pairs():
-    ret = ast.parse(
-        """if a == b:
-    foo(a)
-    foo(b)"""
-    ).body[0]
-    assert isinstance(ret, ast.If)
-    result = get_if_body_pairs(ret)
-    assert len(result) == 1
-    comp = result[0][0]
-    assert isinstance(comp, ast.Compare)
-    assert isinstance(result[0][1], list)
-    assert isinstance(comp.left, ast.Name)
-    assert len(comp.ops) == 1
-    assert isinstance(comp.ops[0], ast.Eq)
-    assert len(comp.comparators) == 1
-    assert isinstance(comp.comparators[0], ast.Name)
-    assert comp.left.id == "a"
-    assert comp.comparators[0].id == "b"
-
-
-def test_get_if_body_pairs_2():
-    ret = ast.parse(
-        """if a == b:
-    foo(a)
-    foo(b)
-elif a == b:
-    foo(c)"""
-    ).body[0]
-    assert isinstance(ret, ast.If)
-    result = get_if_body_pairs(ret)
-    assert len(result) == 2
-    comp = result[0][0]
-    assert isinstance(comp, ast.Compare)
-    assert isinstance(result[0][1], list)
-    assert isinstance(comp.left, ast.Name)
-    assert len(comp.ops) == 1
-    assert isinstance(comp.ops[0], ast.Eq)
-    assert len(comp.comparators) == 1
-    assert isinstance(comp.comparators[0], ast.Name)
-    assert comp.left.id == "a"
-    assert comp.comparators[0].id == "b"
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    (
+        ("if a == b:\n    foo(a)\n    foo(b)", [("a == b", 2)]),
+        (
+            "if a == b:\n    foo(a)\n    foo(b)\nelif a == b:\n    foo(c)",
+            [("a == b", 2), ("a == b", 1)],
+        ),
+        ("if a:\n    b\nelse:\n    c", [("a", 1)]),
+    ),
+)
+def test_get_if_body_pairs(code, expected):
+    node = ast.parse(code).body[0]
+    assert isinstance(node, ast.If)
+    result = get_if_body_pairs(node)
+    assert [(to_source(test), len(body)) for test, body in result] == expected
+
+
+def test_to_source_cache(monkeypatch):
+    calls = []
+
+    def counting_unparse(node):
+        calls.append(node)
+        return unparse(node)
+
+    monkeypatch.setattr(flake8_simplify.utils, "unparse", counting_unparse)
+    node = ast.parse("foo(a,b)").body[0]
+    assert isinstance(node, ast.Expr)
+    assert to_source(node.value) == "foo(a, b)"
+    assert to_source(node.value) == "foo(a, b)"
+    assert calls == [node.value]
+    reset_to_source_cache()
+    assert to_source(node.value) == "foo(a, b)"
+    assert calls == [node.value, node.value]
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        "a",
+        "a.b",
+        "a.b.c",
+        "(a + b).c",
+        "True",
+        "None",
+        "42",
+        "1.5",
+        "''",
+        "'a b'",
+        "'\u00e4'",
+        '"it\'s"',
+        "'a\\nb'",
+    ),
+)
+def test_to_source_shortcuts(code):
+    node = ast.parse(code).body[0]
+    assert isinstance(node, ast.Expr)
+    expected = strip_parenthesis(unparse(node.value).strip())
+    expected = use_double_quotes(strip_triple_quotes(expected))
+    assert to_source(node.value) == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    (
+        "",
+        "a",
+        "(a)",
+        "(a, b)",
+        "'a'",
+        "'''a'''",
+        '"a"',
+        '"""a"""',
+        '"""a"b"""',
+        "('a')",
+    ),
+)
+def test_normalize_source(string):
+    expected = strip_parenthesis(strip_generator_parenthesis(string))
+    expected = use_double_quotes(strip_triple_quotes(expected))
+    assert normalize_source(string) == expected
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    (
+        ("f((x for x in y))", "f(x for x in y)"),
+        ("f(a)((x for x in y))[0]", "f(a)(x for x in y)[0]"),
+        ("f(((a, b) for a, b in c))", "f((a, b) for a, b in c)"),
+        ("f(g((x for x in y)) for y in z)", "f(g(x for x in y) for y in z)"),
+        ("f((x for x in y), 1)", "f((x for x in y), 1)"),
+        ("f(*(x for x in y))", "f(*(x for x in y))"),
+        ("f(([x for x in y]))", "f(([x for x in y]))"),
+        ("f((a + b))", "f((a + b))"),
+        ('f("((x for x in y))")', 'f("((x for x in y))")'),
+    ),
+)
+def test_strip_generator_parenthesis(string, expected):
+    assert strip_generator_parenthesis(string) == expected
+
+
+def test_parse_options_skips_disabled_rules(monkeypatch):
+    for attr in ("_rules", "_call_rules", "_if_rules", "_if_else_rules"):
+        monkeypatch.setattr(Plugin, attr, getattr(Plugin, attr))
+    options = argparse.Namespace(
+        select=None,
+        extend_select=None,
+        ignore=["SIM1", "SIM202"],
+        extend_ignore=None,
+        extended_default_select=["SIM"],
+        extended_default_ignore=[],
+    )
+    Plugin.parse_options(options)
+    assert get_sim102 not in Plugin._if_rules
+    assert get_sim201_sim203 in Plugin._rules[ast.UnaryOp]
+    tree = ast.parse("if a:\n    if b:\n        c\nnot a == b")
+    messages = [msg for _, _, msg, _ in Plugin(tree).run()]
+    assert messages == ["SIM201 Use 'a != b' instead of 'not a == b'"]
+
+
+def test_parse_options_without_decision_engine(monkeypatch):
+    rules = Plugin._rules
+    monkeypatch.setitem(sys.modules, "flake8.style_guide", None)
+    Plugin.parse_options(argparse.Namespace())
+    assert Plugin._rules is rules
+
+
+def test_rule_codes():
+    assert _rule_codes(get_sim102) == ("SIM102",)
+    assert _rule_codes(get_sim201_sim203) == ("SIM201", "SIM202", "SIM203")
+    with pytest.raises(ValueError):
+        _rule_codes(to_source)